@@ -13,20 +13,68 @@ Features:
 """
 
 import os
+import functools
+import logging
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 from kivy.uix.image import Image
 from kivy.uix.popup import Popup
-from kivy.graphics import Color, Rectangle, RoundedRectangle, Ellipse, Line
+from kivy.graphics import (
+    Color, Rectangle, RoundedRectangle, Ellipse, Line, InstructionGroup,
+    PushMatrix, PopMatrix, Scale
+)
+from kivy.properties import BooleanProperty, NumericProperty
+from kivy.core.text import Label as CoreLabel
+from kivy.core.image import Image as CoreImage
 from kivy.animation import Animation
 from kivy.clock import Clock
 
 from core.config import Theme, ResponsiveUtils, IconManager, AppConfig
 
+log = logging.getLogger('ams.widgets')
+
+# Responsive dp values used by the canvas code, refreshed on window resize
+_DP1 = _DP2 = _DP3 = _DP4 = _DP8 = _DP12 = _DP16 = _DP20 = 0
+_DP40 = _DP65 = _DP75 = _DP85 = 0
+
+def _refresh_dp_cache():
+    """Recompute the module-level responsive dp constants"""
+    global _DP1, _DP2, _DP3, _DP4, _DP8, _DP12, _DP16, _DP20
+    global _DP40, _DP65, _DP75, _DP85
+    rdp = ResponsiveUtils.responsive_dp
+    _DP1, _DP2, _DP3, _DP4 = rdp(1), rdp(2), rdp(3), rdp(4)
+    _DP8, _DP12, _DP16, _DP20 = rdp(8), rdp(12), rdp(16), rdp(20)
+    _DP40, _DP65, _DP75, _DP85 = rdp(40), rdp(65), rdp(75), rdp(85)
+
+_refresh_dp_cache()
+ResponsiveUtils.add_resize_listener(_refresh_dp_cache)
+
+# Decoded image textures shared between widgets, keyed by file path
+_TEXTURE_CACHE = {}
+
+def _get_texture(path):
+    """Load an image file once and reuse its texture (None if unreadable)"""
+    texture = _TEXTURE_CACHE.get(path)
+    if texture is None:
+        try:
+            texture = CoreImage(path).texture
+        except Exception as exc:
+            # Failures are not cached so a replaced file can load later
+            log.warning("Unable to load image %s: %s", path, exc)
+            return None
+        _TEXTURE_CACHE[path] = texture
+    return texture
+
+# Constructor kwargs that replace Kivy's default button images and tint
+_BUTTON_STYLE_RESET = {
+    'background_normal': '',
+    'background_down': '',
+    'background_color': (0, 0, 0, 0)
+}
+
 class ResponsiveButton(Button):
     """
     Professional responsive button with enhanced theming and touch feedback
@@ -38,7 +86,32 @@ class ResponsiveButton(Button):
     - Touch feedback and visual states
     """
     
+    # Scale factor applied around the button center for press feedback
+    press_scale = NumericProperty(1.0)
+    
+    # Responsive font size for each button size type
+    FONT_SIZE_MAP = {
+        'tiny': 'small',
+        'small': 'small', 
+        'normal': 'normal',
+        'medium': 'medium',
+        'large': 'large',
+        'xlarge': 'large',
+        'hero': 'xlarge'
+    }
+    
     def __init__(self, button_type='primary', icon=None, size_type='normal', **kwargs):
+        # Remove default Kivy button styling
+        kwargs.update(_BUTTON_STYLE_RESET)
+        
+        # Set responsive sizing and font during construction
+        if not kwargs.get('size'):
+            kwargs['size_hint'] = (None, None)
+            kwargs['size'] = ResponsiveUtils.button_size(size_type)
+        kwargs.setdefault('font_size', ResponsiveUtils.font_size(
+            self.FONT_SIZE_MAP.get(size_type, 'normal')
+        ))
+        
         super().__init__(**kwargs)
         
         # Store button configuration
@@ -46,36 +119,37 @@ class ResponsiveButton(Button):
         self.icon = icon
         self.size_type = size_type
         
-        # Remove default Kivy button styling
-        self.background_normal = ''
-        self.background_down = ''
-        self.background_color = (0, 0, 0, 0)
-        
-        # Set responsive sizing
-        if not kwargs.get('size'):
-            self.size_hint = (None, None)
-            self.size = ResponsiveUtils.button_size(size_type)
-        
         # Setup appearance and behavior
+        self._last_geom = None
         self.setup_appearance()
         self.setup_animations()
+        self._create_graphics()
         
         # Bind events for updates
-        self.bind(pos=self.update_graphics, size=self.update_graphics)
-        Clock.schedule_once(lambda dt: self.update_graphics(), 0.1)
+        # Coalesce pos/size events of one frame into a single sync
+        self._trigger_sync = Clock.create_trigger(self._sync_graphics, -1)
+        self.fbind('pos', self._trigger_sync)
+        self.fbind('size', self._trigger_sync)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def _color_schemes(theme_name):
+        """Build button color schemes for the active theme (cached per theme)"""
+        palette = Theme.current
+        return {
+            'primary': (palette.primary, palette.surface),
+            'secondary': (palette.surface_variant, palette.primary),
+            'success': (palette.success, palette.surface),
+            'warning': (palette.warning, palette.surface),
+            'error': (palette.error, palette.surface),
+            'surface': (palette.surface, palette.on_surface),
+            'outline': (palette.background, palette.primary)
+        }
     
     def setup_appearance(self):
         """Configure button colors and text based on type"""
-        # Define color schemes for different button types
-        color_schemes = {
-            'primary': (Theme.get('primary'), Theme.get('surface')),
-            'secondary': (Theme.get('surface_variant'), Theme.get('primary')),
-            'success': (Theme.get('success'), Theme.get('surface')),
-            'warning': (Theme.get('warning'), Theme.get('surface')),
-            'error': (Theme.get('error'), Theme.get('surface')),
-            'surface': (Theme.get('surface'), Theme.get('on_surface')),
-            'outline': (Theme.get('background'), Theme.get('primary'))
-        }
+        # Color schemes for different button types
+        color_schemes = self._color_schemes(Theme.get_theme_name())
         
         self.bg_color, self.text_color = color_schemes.get(
             self.button_type, color_schemes['primary']
@@ -94,74 +168,106 @@ class ResponsiveButton(Button):
                     self.text = fallback
         
         # Set responsive font size
-        font_size_map = {
-            'tiny': 'small',
-            'small': 'small', 
-            'normal': 'normal',
-            'medium': 'medium',
-            'large': 'large',
-            'xlarge': 'large',
-            'hero': 'xlarge'
-        }
         self.font_size = ResponsiveUtils.font_size(
-            font_size_map.get(self.size_type, 'normal')
+            self.FONT_SIZE_MAP.get(self.size_type, 'normal')
         )
     
     def setup_animations(self):
         """Setup button animation callbacks"""
-        self.bind(on_press=self.on_press_animation)
-        self.bind(on_release=self.on_release_animation)
+        self.fbind('on_press', self.on_press_animation)
+        self.fbind('on_release', self.on_release_animation)
+    
+    def _create_graphics(self):
+        """Create the retained canvas instructions for the button"""
+        # Press feedback transform (popped again in canvas.after)
+        self._scale = Scale(x=1, y=1, z=1, origin=self.center)
+        
+        # Enhanced shadow effect
+        self._shadow_color = Color(*Theme.get('shadow'))
+        self._shadow_instr = RoundedRectangle()
+        
+        # Main button background
+        self._bg_color_instr = Color(*self.bg_color)
+        self._bg_instr = RoundedRectangle()
+        
+        # Subtle border for definition (invisible for outline buttons)
+        self._border_color = Color(*self._get_border_color())
+        self._border_instr = Line()
+        
+        # Lay out the detached group, then attach it in one step
+        group = InstructionGroup()
+        for instr in (PushMatrix(), self._scale,
+                      self._shadow_color, self._shadow_instr,
+                      self._bg_color_instr, self._bg_instr,
+                      self._border_color, self._border_instr):
+            group.add(instr)
+        self._sync_graphics()
+        
+        self.canvas.before.add(group)
+        self.canvas.after.add(PopMatrix())
+    
+    def _get_border_color(self):
+        """Get border color for the current button type"""
+        if self.button_type == 'outline':
+            return (0, 0, 0, 0)
+        return Theme.get('outline')
     
     def update_graphics(self, *args):
-        """Update button graphics with professional styling"""
-        self.canvas.before.clear()
-        
-        with self.canvas.before:
-            # Enhanced shadow effect
-            Color(*Theme.get('shadow'))
-            shadow_offset = ResponsiveUtils.responsive_dp(3)
-            shadow = RoundedRectangle(
-                size=(self.size[0] + shadow_offset, self.size[1] + shadow_offset),
-                pos=(self.pos[0] + shadow_offset/2, self.pos[1] - shadow_offset/2),
-                radius=[ResponsiveUtils.responsive_dp(12)]
-            )
-            
-            # Main button background
-            Color(*self.bg_color)
-            main_rect = RoundedRectangle(
-                size=self.size,
-                pos=self.pos,
-                radius=[ResponsiveUtils.responsive_dp(12)]
-            )
-            
-            # Subtle border for definition
-            if self.button_type != 'outline':
-                Color(*Theme.get('outline'))
-                border = Line(
-                    rounded_rectangle=(
-                        self.x, self.y, self.width, self.height,
-                        ResponsiveUtils.responsive_dp(12)
-                    ),
-                    width=ResponsiveUtils.responsive_dp(1)
-                )
+        """Update button colors and geometry with professional styling"""
+        self._shadow_color.rgba = Theme.current.shadow
+        self._bg_color_instr.rgba = self.bg_color
+        self._border_color.rgba = self._get_border_color()
+        self._sync_graphics()
+    
+    def _sync_graphics(self, *args):
+        """Move the retained instructions to the current pos/size"""
+        # Skip no-op updates (same geometry to the pixel)
+        geom = (round(self.x), round(self.y), round(self.width), round(self.height))
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
+        
+        radius = _DP12
+        shadow_offset = _DP3
+        x, y = self.pos
+        width, height = self.size
+        
+        self._scale.origin = self.center
+        
+        self._shadow_instr.size = (width + shadow_offset, height + shadow_offset)
+        self._shadow_instr.pos = (x + shadow_offset/2, y - shadow_offset/2)
+        self._shadow_instr.radius = [radius]
+        
+        self._bg_instr.size = (width, height)
+        self._bg_instr.pos = (x, y)
+        self._bg_instr.radius = [radius]
+        
+        self._border_instr.rounded_rectangle = (x, y, width, height, radius)
+        self._border_instr.width = _DP1
     
     def on_press_animation(self, *args):
         """Animate button press with scale effect"""
+        Animation.cancel_all(self, 'press_scale')
         anim = Animation(
-            size=(self.size[0] * 0.95, self.size[1] * 0.95),
+            press_scale=0.95,
             duration=AppConfig.BUTTON_ANIMATION_DURATION
         )
         anim.start(self)
     
     def on_release_animation(self, *args):
         """Animate button release returning to normal size"""
-        original_size = (self.size[0] / 0.95, self.size[1] / 0.95)
+        Animation.cancel_all(self, 'press_scale')
         anim = Animation(
-            size=original_size,
+            press_scale=1.0,
             duration=AppConfig.BUTTON_ANIMATION_DURATION
         )
         anim.start(self)
     
+    def on_press_scale(self, instance, value):
+        """Apply press scale to the canvas transform"""
+        self._scale.x = value
+        self._scale.y = value
+    
     def refresh_theme(self):
         """Refresh button appearance for theme changes"""
         self.setup_appearance()
@@ -179,23 +285,57 @@ class ResponsiveLabel(Label):
     """
     
     def __init__(self, size_type='normal', **kwargs):
+        # Set responsive font size if not specified
+        if not kwargs.get('font_size'):
+            kwargs['font_size'] = ResponsiveUtils.font_size(size_type)
+        
+        # Enable text wrapping by default
+        kwargs.setdefault('text_size', (None, None))
+        
         super().__init__(**kwargs)
         
         self.size_type = size_type
         
-        # Set responsive font size if not specified
-        if not kwargs.get('font_size'):
-            self.font_size = ResponsiveUtils.font_size(size_type)
-        
         # Set theme-appropriate color
         self.color = Theme.get('on_surface')
-        
-        # Enable text wrapping by default
-        self.text_size = kwargs.get('text_size', (None, None))
     
     def refresh_theme(self):
         """Refresh label appearance for theme changes"""
-        self.color = Theme.get('on_surface')
+        self.color = Theme.current.on_surface
+
+class StaticLabel(Widget):
+    """
+    Lightweight label for text that never changes
+    
+    Renders its text once into a texture drawn by a single rectangle,
+    skipping Label's reactive text properties. Rebuild it to change text.
+    """
+    
+    def __init__(self, text='', size_type='normal', color=None, bold=False, **kwargs):
+        super().__init__(**kwargs)
+        
+        # Render the text once into a texture
+        caption = CoreLabel(
+            text=text,
+            font_size=ResponsiveUtils.font_size(size_type),
+            color=color or Theme.current.on_surface,
+            bold=bold
+        )
+        caption.refresh()
+        
+        with self.canvas:
+            Color(1, 1, 1, 1)
+            self._caption = Rectangle(
+                texture=caption.texture,
+                size=caption.texture.size
+            )
+        self.fbind('pos', self._sync_caption)
+        self.fbind('size', self._sync_caption)
+    
+    def _sync_caption(self, *args):
+        """Center the caption in the widget"""
+        width, height = self._caption.size
+        self._caption.pos = (self.center_x - width / 2, self.center_y - height / 2)
 
 class StatusIndicator(Widget):
     """
@@ -208,8 +348,22 @@ class StatusIndicator(Widget):
     - Theme-aware coloring
     """
     
+    # Circle scale relative to the widget, tweened by the pulse animation
+    pulse_scale = NumericProperty(1.0)
+    
+    # Pulse animation is opt-in; a static indicator costs no per-frame work
+    enable_pulse = BooleanProperty(False)
+    
+    # Largest circle scale reached during a pulse
+    PULSE_MAX_SCALE = 1.3
+    
+    # Statuses that pulse when enable_pulse is set
+    PULSE_STATUSES = ('active', 'scanning', 'connecting')
+    
     def __init__(self, status='active', size_type='normal', **kwargs):
         super().__init__(**kwargs)
+        self._pulse = None
+        self._detached_root = None
         
         self.status = status
         self.size_hint = (None, None)
@@ -219,8 +373,15 @@ class StatusIndicator(Widget):
         self.size = (size, size)
         
         # Setup graphics and animations
-        self.update_graphics()
-        self.bind(pos=self.update_graphics, size=self.update_graphics)
+        with self.canvas:
+            self._color_instr = Color(*self.get_status_color())
+            self.circle = Ellipse(pos=self.pos, size=self.size)
+        self.fbind('pos', self._sync_graphics)
+        self.fbind('size', self._sync_graphics)
+        
+        # Pulse while enabled; a cycle ending offscreen parks it until reattached
+        self.fbind('enable_pulse', self.animate_pulse)
+        self.fbind('parent', self.animate_pulse)
         self.animate_pulse()
     
     def get_status_color(self):
@@ -236,34 +397,84 @@ class StatusIndicator(Widget):
         return status_colors.get(self.status, Theme.get('primary'))
     
     def update_graphics(self, *args):
-        """Update status indicator graphics"""
-        self.canvas.clear()
-        
-        with self.canvas:
-            Color(*self.get_status_color())
-            self.circle = Ellipse(pos=self.pos, size=self.size)
+        """Update status indicator color and geometry"""
+        self._color_instr.rgba = self.get_status_color()
+        self._sync_graphics()
     
-    def animate_pulse(self):
-        """Animate pulsing effect for active status"""
-        if self.status in ['active', 'scanning', 'connecting']:
-            # pulse_size = self.size[0] * 1.3
-            pulse_size = self.size[0] * 0
-            normal_size = self.size[0]
-            
-            # Create pulsing animation
-            anim = (
-                Animation(size=(pulse_size, pulse_size), duration=1.0) +
-                Animation(size=(normal_size, normal_size), duration=1.0)
-            )
-            anim.repeat = True
-            anim.start(self)
+    def _sync_graphics(self, *args):
+        """Size the indicator circle around the widget center"""
+        width = self.width * self.pulse_scale
+        height = self.height * self.pulse_scale
+        self.circle.size = (width, height)
+        self.circle.pos = (self.center_x - width / 2, self.center_y - height / 2)
+    
+    def on_pulse_scale(self, instance, value):
+        """Resize only the circle while pulsing; widget size is untouched"""
+        self._sync_graphics()
+    
+    def animate_pulse(self, *args):
+        """Start or stop the pulse to match status and setting"""
+        if self.enable_pulse and self.status in self.PULSE_STATUSES:
+            if self._pulse is None:
+                self._start_pulse_cycle()
+        else:
+            self.stop_pulse()
+    
+    def _start_pulse_cycle(self, *args):
+        """Run one grow/shrink cycle"""
+        self._pulse = (
+            Animation(pulse_scale=self.PULSE_MAX_SCALE, duration=1.0) +
+            Animation(pulse_scale=1.0, duration=1.0)
+        )
+        self._pulse.fbind('on_complete', self._on_pulse_cycle_done)
+        self._pulse.start(self)
+    
+    def _on_pulse_cycle_done(self, animation, widget):
+        """Continue pulsing only while still shown in the window"""
+        self._pulse = None
+        if self.get_root_window() is not None:
+            self.animate_pulse()
+        else:
+            self._wait_for_window()
+    
+    def _wait_for_window(self):
+        """Resume the pulse when the detached top ancestor gets a parent"""
+        self._release_detached_root()
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        self._detached_root = root
+        root.fbind('parent', self._on_root_attached)
+    
+    def _on_root_attached(self, root, parent):
+        """Restart pulsing once back in the window, else keep waiting"""
+        self._release_detached_root()
+        if self.get_root_window() is not None:
+            self.animate_pulse()
+        else:
+            self._wait_for_window()
+    
+    def _release_detached_root(self):
+        """Drop the pending reattach hook, if any"""
+        if self._detached_root is not None:
+            self._detached_root.funbind('parent', self._on_root_attached)
+            self._detached_root = None
+    
+    def stop_pulse(self):
+        """Stop pulsing and restore the resting circle size"""
+        self._release_detached_root()
+        if self._pulse is not None:
+            self._pulse.funbind('on_complete', self._on_pulse_cycle_done)
+            self._pulse.cancel(self)
+            self._pulse = None
+        self.pulse_scale = 1.0
     
     def set_status(self, new_status):
         """Change indicator status"""
         self.status = new_status
-        self.update_graphics()
         # Restart animation with new status
-        Animation.cancel_all(self)
+        self.stop_pulse()
+        self.update_graphics()
         self.animate_pulse()
 
 class SecureTextInput(BoxLayout):
@@ -290,9 +501,9 @@ class SecureTextInput(BoxLayout):
         self.spacing = spacing_value
         self.size_hint = (None, None)
         
-        box_size = ResponsiveUtils.responsive_dp(65)
+        box_size = _DP65
         total_width = max_length * box_size + (max_length - 1) * spacing_value
-        self.size = (total_width, ResponsiveUtils.responsive_dp(75))
+        self.size = (total_width, _DP75)
         
         # Create input boxes
         self._create_input_boxes(box_size)
@@ -304,75 +515,84 @@ class SecureTextInput(BoxLayout):
                 text='',
                 font_size=ResponsiveUtils.font_size('large'),
                 size_hint=(None, None),
-                size=(box_size, ResponsiveUtils.responsive_dp(75)),
+                size=(box_size, _DP75),
                 halign='center',
                 valign='middle'
             )
             
             # Enable text size binding for proper centering
-            box.bind(texture_size=box.setter('text_size'))
+            box.fbind('texture_size', box.setter('text_size'))
             
             # Setup box styling
-            self._update_box_graphics(box)
-            box.bind(
-                pos=lambda instance, value, b=box: self._update_box_graphics(b),
-                size=lambda instance, value, b=box: self._update_box_graphics(b)
-            )
+            self._create_box_graphics(box)
+            box.fbind('pos', self._on_box_layout)
+            box.fbind('size', self._on_box_layout)
             
             self.input_boxes.append(box)
             self.add_widget(box)
     
-    def _update_box_graphics(self, box, *args):
-        """Update individual box graphics"""
-        box.canvas.before.clear()
-        
-        with box.canvas.before:
-            # Background
-            Color(*Theme.get('surface'))
-            bg_rect = RoundedRectangle(
-                size=box.size,
-                pos=box.pos,
-                radius=[ResponsiveUtils.responsive_dp(12)]
-            )
-            
-            # Border
-            Color(*Theme.get('outline'))
-            border = Line(
-                rounded_rectangle=(
-                    box.x, box.y, box.width, box.height,
-                    ResponsiveUtils.responsive_dp(12)
-                ),
-                width=ResponsiveUtils.responsive_dp(2)
-            )
+    def _create_box_graphics(self, box):
+        """Create the retained instructions for an input box"""
+        radius = _DP12
+        group = InstructionGroup()
+        
+        # Background
+        box._bg_color = Color(*Theme.get('surface'))
+        box._bg_rect = RoundedRectangle(
+            size=box.size,
+            pos=box.pos,
+            radius=[radius]
+        )
+        group.add(box._bg_color)
+        group.add(box._bg_rect)
+        
+        # Border
+        box._border_color = Color(*Theme.get('outline'))
+        box._border = Line(
+            rounded_rectangle=(box.x, box.y, box.width, box.height, radius),
+            width=_DP2
+        )
+        group.add(box._border_color)
+        group.add(box._border)
+        
+        box.canvas.before.add(group)
+    
+    def _set_box_state(self, box, filled):
+        """Switch a box between its empty and filled styles"""
+        if filled:
+            # Highlight active box (no border)
+            box._bg_color.rgba = Theme.get('primary')
+            box._border_color.rgba = (0, 0, 0, 0)
+            box.color = Theme.get('surface')
+            box.text = '●'  # Secure bullet point
+        else:
+            box._bg_color.rgba = Theme.get('surface')
+            box._border_color.rgba = Theme.get('outline')
+            box.color = Theme.get('on_surface')
+            box.text = ''
+    
+    def _on_box_layout(self, box, value):
+        """Move a box's retained instructions to its current pos/size"""
+        box._bg_rect.pos = box.pos
+        box._bg_rect.size = box.size
+        box._border.rounded_rectangle = (
+            box.x, box.y, box.width, box.height, _DP12
+        )
     
     def update_display(self, value):
         """Update secure display with bullet points"""
         self.current_value = value
+        filled_count = len(value)
         
         for i, box in enumerate(self.input_boxes):
-            if i < len(value):
-                box.text = '●'  # Secure bullet point
-                # Highlight active box
-                box.canvas.before.clear()
-                with box.canvas.before:
-                    Color(*Theme.get('primary'))
-                    bg_rect = RoundedRectangle(
-                        size=box.size,
-                        pos=box.pos,
-                        radius=[ResponsiveUtils.responsive_dp(12)]
-                    )
-                box.color = Theme.get('surface')
-            else:
-                box.text = ''
-                self._update_box_graphics(box)
-                box.color = Theme.get('on_surface')
+            self._set_box_state(box, i < filled_count)
     
     def clear(self):
         """Clear all input displays"""
         self.current_value = ""
         self.update_display("")
 
-class ResponsiveKeypad(GridLayout):
+class ResponsiveKeypad(Widget):
     """
     Professional responsive numeric keypad
     
@@ -381,8 +601,30 @@ class ResponsiveKeypad(GridLayout):
     - Responsive sizing and spacing
     - Professional button styling
     - Callback system for key presses
+    
+    Keys are drawn as retained canvas instructions on a single widget
+    instead of twelve child buttons; touches are dispatched by hit-testing
+    the precomputed key rectangles.
     """
     
+    # Background/text theme keys per button type (mirrors ResponsiveButton)
+    KEY_COLORS = {
+        'secondary': ('surface_variant', 'primary'),
+        'warning': ('warning', 'surface'),
+        'success': ('success', 'surface')
+    }
+    
+    # Opacity applied to a key background while it is held down
+    PRESSED_ALPHA = 0.7
+    
+    # Key layout: (label, button type, value passed to the callback)
+    BUTTON_CONFIG = (
+        ('1', 'secondary', '1'), ('2', 'secondary', '2'), ('3', 'secondary', '3'),
+        ('4', 'secondary', '4'), ('5', 'secondary', '5'), ('6', 'secondary', '6'),
+        ('7', 'secondary', '7'), ('8', 'secondary', '8'), ('9', 'secondary', '9'),
+        ('CLEAR', 'warning', 'Clear'), ('0', 'secondary', '0'), ('ENTER', 'success', 'Enter')
+    )
+    
     def __init__(self, callback=None, **kwargs):
         super().__init__(**kwargs)
         
@@ -395,45 +637,141 @@ class ResponsiveKeypad(GridLayout):
         self.spacing = button_spacing
         self.size_hint = (None, None)
         
-        button_size = ResponsiveUtils.responsive_dp(85)
+        button_size = _DP85
+        self.button_size = button_size
         total_width = 3 * button_size + 2 * button_spacing
         total_height = 4 * button_size + 3 * button_spacing
         self.size = (total_width, total_height)
         
-        # Create keypad buttons
+        # Create keypad keys
+        self._keys = []
+        self._last_geom = None
         self._create_keypad_buttons(button_size)
+        self._sync_graphics()
+        
+        # Coalesce pos/size events of one frame into a single sync
+        self._trigger_sync = Clock.create_trigger(self._sync_graphics, -1)
+        self.fbind('pos', self._trigger_sync)
+        self.fbind('size', self._trigger_sync)
     
     def _create_keypad_buttons(self, button_size):
-        """Create keypad button layout"""
-        button_config = [
-            ('1', 'secondary'), ('2', 'secondary'), ('3', 'secondary'),
-            ('4', 'secondary'), ('5', 'secondary'), ('6', 'secondary'),
-            ('7', 'secondary'), ('8', 'secondary'), ('9', 'secondary'),
-            ('CLEAR', 'warning'), ('0', 'secondary'), ('ENTER', 'success')
-        ]
-        
-        for btn_text, btn_type in button_config:
-            btn = ResponsiveButton(
+        """Create keypad key instructions"""
+        font_size = ResponsiveUtils.font_size('medium')
+        
+        for btn_text, btn_type, value in self.BUTTON_CONFIG:
+            bg_key, text_key = self.KEY_COLORS[btn_type]
+            
+            # Render the key caption once into a texture
+            caption = CoreLabel(
                 text=btn_text,
-                button_type=btn_type,
-                font_size=ResponsiveUtils.font_size('medium'),
-                size_hint=(None, None),
-                size=(button_size, button_size)
+                font_size=font_size,
+                color=Theme.get(text_key)
             )
-            btn.bind(on_press=self._on_key_press)
-            self.add_widget(btn)
+            caption.refresh()
+            
+            key = {
+                'value': value,
+                'shadow_color': Color(*Theme.get('shadow')),
+                'shadow': RoundedRectangle(),
+                'bg_color': Color(*Theme.get(bg_key)),
+                'bg': RoundedRectangle(),
+                'border_color': Color(*Theme.get('outline')),
+                'border': Line(),
+                'text_color': Color(1, 1, 1, 1),
+                'caption': Rectangle(
+                    texture=caption.texture,
+                    size=caption.texture.size
+                )
+            }
+            
+            # One instruction group per cell
+            group = InstructionGroup()
+            for name in ('shadow_color', 'shadow', 'bg_color', 'bg',
+                         'border_color', 'border', 'text_color', 'caption'):
+                group.add(key[name])
+            self.canvas.add(group)
+            self._keys.append(key)
     
-    def _on_key_press(self, button):
-        """Handle keypad button press"""
-        if self.callback:
-            # Standardize button text
-            text = button.text.strip()
-            if text == 'CLEAR':
-                text = 'Clear'
-            elif text == 'ENTER':
-                text = 'Enter'
+    def _sync_graphics(self, *args):
+        """Position every key in a 3x4 grid filled from the top-left"""
+        # Skip no-op updates (same geometry to the pixel)
+        geom = (round(self.x), round(self.y), round(self.width), round(self.height))
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
+        
+        radius = _DP12
+        shadow_offset = _DP3
+        size = self.button_size
+        stride = size + self.spacing
+        
+        for index, key in enumerate(self._keys):
+            row, col = divmod(index, self.cols)
+            x = self.x + col * stride
+            y = self.top - size - row * stride
+            
+            key['shadow'].size = (size + shadow_offset, size + shadow_offset)
+            key['shadow'].pos = (x + shadow_offset/2, y - shadow_offset/2)
+            key['shadow'].radius = [radius]
+            
+            key['bg'].size = (size, size)
+            key['bg'].pos = (x, y)
+            key['bg'].radius = [radius]
+            
+            key['border'].rounded_rectangle = (x, y, size, size, radius)
+            key['border'].width = _DP1
             
-            self.callback(text)
+            text_w, text_h = key['caption'].size
+            key['caption'].pos = (
+                x + (size - text_w) / 2,
+                y + (size - text_h) / 2
+            )
+    
+    def _key_at(self, x, y):
+        """Return the key under the point, or None for the spacing gaps"""
+        stride = self.button_size + self.spacing
+        
+        # Rows are counted from the top edge, matching the layout
+        col, offset_x = divmod(x - self.x, stride)
+        row, offset_y = divmod(self.top - y, stride)
+        if offset_x > self.button_size or offset_y > self.button_size:
+            return None
+        
+        col, row = int(col), int(row)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self._keys[row * self.cols + col]
+        return None
+    
+    def on_touch_down(self, touch):
+        """Dispatch a touch to the key under it"""
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+        
+        key = self._key_at(*touch.pos)
+        if key is None:
+            return True
+        
+        key['bg_color'].a = self.PRESSED_ALPHA
+        touch.grab(self)
+        touch.ud[self] = key
+        self._on_key_press(key)
+        return True
+    
+    def on_touch_up(self, touch):
+        """Restore the pressed key when the touch is released"""
+        if touch.grab_current is not self:
+            return super().on_touch_up(touch)
+        
+        touch.ungrab(self)
+        key = touch.ud.pop(self, None)
+        if key is not None:
+            key['bg_color'].a = 1
+        return True
+    
+    def _on_key_press(self, key):
+        """Handle keypad key press"""
+        if self.callback:
+            self.callback(key['value'])
 
 class ScanningBar(Widget):
     """
@@ -446,13 +784,18 @@ class ScanningBar(Widget):
     - Configurable animation parameters
     """
     
+    # Relative scan progress (0.0 - 1.0), driven by Animation
+    scan_position = NumericProperty(0)
+    
+    # Duration of one scan sweep in seconds
+    CARD_SWEEP_DURATION = 2.2
+    BIOMETRIC_SWEEP_DURATION = 1.3
+    
     def __init__(self, scan_type='card', **kwargs):
         super().__init__(**kwargs)
         
         self.scan_type = scan_type
         self.scanning = False
-        self.scan_position = 0
-        self.scan_direction = 1
         
         # Set responsive size based on scan type
         self.size_hint = (None, None)
@@ -468,107 +811,133 @@ class ScanningBar(Widget):
             )
         
         # Setup graphics
-        self.bind(size=self.update_graphics, pos=self.update_graphics)
-        self.update_graphics()
+        self._last_geom = None
+        self._create_graphics()
+        
+        # Coalesce pos/size events of one frame into a single sync
+        self._trigger_sync = Clock.create_trigger(self._sync_graphics, -1)
+        self.fbind('pos', self._trigger_sync)
+        self.fbind('size', self._trigger_sync)
     
-    def update_graphics(self, *args):
-        """Update scanning bar graphics"""
-        self.canvas.clear()
+    def _create_graphics(self):
+        """Create the retained canvas instructions for the scanner overlay"""
+        is_card = self.scan_type == 'card'
         
-        with self.canvas:
-            # Background
-            Color(*Theme.get('scan_bar_bg'))
-            if self.scan_type == 'card':
-                bg_rect = RoundedRectangle(
-                    size=self.size,
-                    pos=self.pos,
-                    radius=[ResponsiveUtils.responsive_dp(16)]
-                )
-            else:
-                bg_circle = Ellipse(size=self.size, pos=self.pos)
-            
-            # Border
-            Color(*Theme.get('outline'))
-            border_width = ResponsiveUtils.responsive_dp(3)
-            if self.scan_type == 'card':
-                border = Line(
-                    rounded_rectangle=(
-                        self.x, self.y, self.width, self.height,
-                        ResponsiveUtils.responsive_dp(16)
-                    ),
-                    width=border_width
-                )
-            else:
-                border = Line(
-                    ellipse=(self.x, self.y, self.width, self.height),
-                    width=border_width
-                )
-            
-            # Scanning animation
-            if self.scanning:
-                Color(*Theme.get('scan_bar'))
-                if self.scan_type == 'card':
-                    self._draw_card_scan()
-                else:
-                    self._draw_biometric_scan()
+        # Background
+        self._bg_color = Color(*Theme.get('scan_bar_bg'))
+        self._bg_instr = RoundedRectangle() if is_card else Ellipse()
+        
+        # Border
+        self._border_color = Color(*Theme.get('outline'))
+        self._border_instr = Line()
+        
+        # Scanning element, attached to the canvas only while scanning
+        self._scan_color = Color(*Theme.get('scan_bar'))
+        self._scan_instr = RoundedRectangle() if is_card else Line()
+        self._scan_group = InstructionGroup()
+        self._scan_group.add(self._scan_color)
+        self._scan_group.add(self._scan_instr)
+        
+        # Lay out the detached group, then attach it in one step
+        group = InstructionGroup()
+        for instr in (self._bg_color, self._bg_instr,
+                      self._border_color, self._border_instr):
+            group.add(instr)
+        self._sync_graphics()
+        
+        self.canvas.add(group)
+    
+    def update_graphics(self, *args):
+        """Update scanning bar colors and geometry"""
+        self._bg_color.rgba = Theme.get('scan_bar_bg')
+        self._border_color.rgba = Theme.get('outline')
+        self._scan_color.rgba = Theme.get('scan_bar')
+        self._sync_graphics()
     
-    def _draw_card_scan(self):
-        """Draw card scanning line"""
-        line_height = ResponsiveUtils.responsive_dp(4)
-        line_y = self.y + (self.height * self.scan_position) - line_height/2
+    def _sync_graphics(self, *args):
+        """Move the static background and border to the current pos/size"""
+        # Skip no-op updates (same geometry to the pixel)
+        geom = (round(self.x), round(self.y), round(self.width), round(self.height))
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
         
-        scan_line = RoundedRectangle(
-            pos=(self.x + ResponsiveUtils.responsive_dp(20), line_y),
-            size=(self.width - ResponsiveUtils.responsive_dp(40), line_height),
-            radius=[ResponsiveUtils.responsive_dp(2)]
-        )
+        self._bg_instr.pos = self.pos
+        self._bg_instr.size = self.size
+        
+        self._border_instr.width = _DP3
+        if self.scan_type == 'card':
+            radius = _DP16
+            self._bg_instr.radius = [radius]
+            self._border_instr.rounded_rectangle = (
+                self.x, self.y, self.width, self.height, radius
+            )
+        else:
+            self._border_instr.ellipse = (self.x, self.y, self.width, self.height)
+        
+        # Static scan element geometry; _sync_scan only applies the progress
+        if self.scan_type == 'card':
+            # Card scanning line
+            line_height = _DP4
+            self._scan_instr.size = (self.width - _DP40, line_height)
+            self._scan_instr.radius = [_DP2]
+            self._scan_origin = (self.x + _DP20, self.y - line_height/2)
+            self._scan_extent = self.height
+        else:
+            # Biometric scanning circle
+            self._scan_instr.width = _DP4
+            self._scan_origin = self.center
+            self._scan_extent = self.width * 0.8
+        
+        self._sync_scan()
     
-    def _draw_biometric_scan(self):
-        """Draw biometric scanning circle"""
-        circle_size = self.width * self.scan_position * 0.8
-        circle_pos_x = self.center_x - circle_size/2
-        circle_pos_y = self.center_y - circle_size/2
+    def _sync_scan(self):
+        """Move the scanning element to the current scan position"""
+        x0, y0 = self._scan_origin
+        offset = self._scan_extent * self.scan_position
         
-        scan_circle = Line(
-            ellipse=(circle_pos_x, circle_pos_y, circle_size, circle_size),
-            width=ResponsiveUtils.responsive_dp(4)
-        )
+        if self.scan_type == 'card':
+            self._scan_instr.pos = (x0, y0 + offset)
+        else:
+            half = offset / 2
+            self._scan_instr.ellipse = (x0 - half, y0 - half, offset, offset)
     
     def start_scanning(self):
         """Start scanning animation"""
+        if not self.scanning:
+            self.canvas.add(self._scan_group)
         self.scanning = True
+        
+        Animation.cancel_all(self, 'scan_position')
         self.scan_position = 0
-        self.scan_direction = 1
-        Clock.schedule_interval(self._animate_scan, 1/AppConfig.SCAN_FPS)
+        self._sync_scan()
+        
+        if self.scan_type == 'card':
+            # Bouncing line animation
+            anim = (
+                Animation(scan_position=1.0, duration=self.CARD_SWEEP_DURATION) +
+                Animation(scan_position=0.0, duration=self.CARD_SWEEP_DURATION)
+            )
+        else:
+            # Expanding circle animation, restarting from the center
+            anim = (
+                Animation(scan_position=1.0, duration=self.BIOMETRIC_SWEEP_DURATION) +
+                Animation(scan_position=0.0, duration=0)
+            )
+        anim.repeat = True
+        anim.start(self)
     
     def stop_scanning(self):
         """Stop scanning animation"""
+        if self.scanning:
+            self.canvas.remove(self._scan_group)
         self.scanning = False
-        Clock.unschedule(self._animate_scan)
-        self.update_graphics()
+        Animation.cancel_all(self, 'scan_position')
     
-    def _animate_scan(self, dt):
-        """Animate scanning effect"""
-        if not self.scanning:
-            return False
-        
-        if self.scan_type == 'card':
-            # Bouncing line animation
-            self.scan_position += self.scan_direction * 0.015
-            if self.scan_position >= 1.0:
-                self.scan_position = 1.0
-                self.scan_direction = -1
-            elif self.scan_position <= 0.0:
-                self.scan_position = 0.0
-                self.scan_direction = 1
-        else:
-            # Expanding circle animation
-            self.scan_position += 0.025
-            if self.scan_position >= 1.0:
-                self.scan_position = 0.0
-        
-        self.update_graphics()
-        return True
+    def on_scan_position(self, instance, value):
+        """Move the scanning element while the animation runs"""
+        if self.scanning:
+            self._sync_scan()
 
 class EnhancedPopup(Popup):
     """
@@ -592,10 +961,20 @@ class EnhancedPopup(Popup):
         
         # Apply theming
         self._setup_appearance()
-        
-        # Setup auto-dismiss
-        if auto_dismiss_time > 0:
-            Clock.schedule_once(self._auto_dismiss, auto_dismiss_time)
+    
+    def on_open(self):
+        """Start the auto-dismiss countdown each time the popup opens"""
+        self._restart_auto_dismiss()
+    
+    def _restart_auto_dismiss(self):
+        """(Re)start the auto-dismiss countdown"""
+        Clock.unschedule(self._auto_dismiss)
+        if self.auto_dismiss_time > 0:
+            Clock.schedule_once(self._auto_dismiss, self.auto_dismiss_time)
+    
+    def on_dismiss(self):
+        """Stop a pending auto-dismiss when closed early"""
+        Clock.unschedule(self._auto_dismiss)
     
     def _setup_appearance(self):
         """Setup popup appearance based on type"""
@@ -645,18 +1024,17 @@ class ImageIcon(Widget):
     def create_icon(self):
         """Create icon from image or fallback to text"""
         icon_path = IconManager.get_icon_path(self.icon_name)
+        texture = _get_texture(icon_path) if icon_path else None
         
-        if icon_path:
+        if texture is not None:
             # Use image icon
             self.image_widget = Image(
-                source=icon_path,
+                texture=texture,
                 size=self.size,
                 pos=self.pos
             )
-            self.bind(
-                pos=self._update_image_pos,
-                size=self._update_image_size
-            )
+            self.fbind('pos', self._update_image_pos)
+            self.fbind('size', self._update_image_size)
             self.add_widget(self.image_widget)
         else:
             # Use fallback text
@@ -670,10 +1048,8 @@ class ImageIcon(Widget):
                 halign='center',
                 valign='middle'
             )
-            self.bind(
-                pos=self._update_label_pos,
-                size=self._update_label_size
-            )
+            self.fbind('pos', self._update_label_pos)
+            self.fbind('size', self._update_label_size)
             self.add_widget(self.label_widget)
     
     def _update_image_pos(self, instance, pos):
@@ -707,6 +1083,9 @@ class ScannerImage(FloatLayout):
     - Professional styling
     """
     
+    # Relative diameters of the fingerprint pattern rings
+    FINGERPRINT_RING_FACTORS = (0.2, 0.35, 0.5, 0.65)
+    
     def __init__(self, scan_type='card', **kwargs):
         super().__init__(**kwargs)
         
@@ -731,11 +1110,12 @@ class ScannerImage(FloatLayout):
     def create_scanner_visual(self):
         """Create scanner visual from image or fallback"""
         scanner_path = IconManager.get_scanner_image(self.scan_type)
+        texture = _get_texture(scanner_path) if scanner_path else None
         
-        if scanner_path:
+        if texture is not None:
             # Use actual scanner device image
             self.image_widget = Image(
-                source=scanner_path,
+                texture=texture,
                 size_hint=(1, 1),
                 pos_hint={'center_x': 0.5, 'center_y': 0.5}
             )
@@ -751,57 +1131,79 @@ class ScannerImage(FloatLayout):
             pos_hint={'center_x': 0.5, 'center_y': 0.5}
         )
         
-        def draw_scanner(widget, *args):
-            widget.canvas.clear()
-            with widget.canvas:
-                if self.scan_type == 'card':
-                    self._draw_card_reader(widget)
-                else:
-                    self._draw_fingerprint_scanner(widget)
+        # Build the retained instructions once; resizes only move them
+        self._scanner_group = InstructionGroup()
+        if self.scan_type == 'card':
+            self._create_card_reader(self._scanner_group)
+        else:
+            self._create_fingerprint_scanner(self._scanner_group)
+        scanner_widget.canvas.add(self._scanner_group)
         
-        scanner_widget.bind(size=draw_scanner, pos=draw_scanner)
+        scanner_widget.fbind('size', self._sync_scanner)
+        scanner_widget.fbind('pos', self._sync_scanner)
         self.add_widget(scanner_widget)
-        Clock.schedule_once(lambda dt: draw_scanner(scanner_widget), 0.1)
+        self._sync_scanner(scanner_widget)
     
-    def _draw_card_reader(self, widget):
-        """Draw professional card reader graphics"""
+    def _sync_scanner(self, widget, *args):
+        """Fit the retained scanner instructions to the widget"""
+        if self.scan_type == 'card':
+            self._sync_card_reader(widget)
+        else:
+            self._sync_fingerprint_scanner(widget)
+    
+    def _create_card_reader(self, group):
+        """Create retained card reader instructions"""
         # Main body
-        Color(*Theme.get('surface_variant'))
-        main_body = RoundedRectangle(
-            size=(widget.width * 0.8, widget.height * 0.6),
-            pos=(widget.center_x - widget.width * 0.4,
-                 widget.center_y - widget.height * 0.3),
-            radius=[ResponsiveUtils.responsive_dp(12)]
-        )
+        group.add(Color(*Theme.get('surface_variant')))
+        self._reader_body = RoundedRectangle()
+        group.add(self._reader_body)
         
         # Card slot
-        Color(*Theme.get('outline'))
-        slot = Rectangle(
-            size=(widget.width * 0.6, ResponsiveUtils.responsive_dp(8)),
-            pos=(widget.center_x - widget.width * 0.3,
-                 widget.center_y - ResponsiveUtils.responsive_dp(4))
-        )
+        group.add(Color(*Theme.get('outline')))
+        self._reader_slot = Rectangle()
+        group.add(self._reader_slot)
     
-    def _draw_fingerprint_scanner(self, widget):
-        """Draw professional fingerprint scanner graphics"""
+    def _sync_card_reader(self, widget):
+        """Fit the retained card reader instructions to the widget"""
+        cx, cy = widget.center
+        width, height = widget.size
+        
+        self._reader_body.size = (width * 0.8, height * 0.6)
+        self._reader_body.pos = (cx - width * 0.4, cy - height * 0.3)
+        self._reader_body.radius = [_DP12]
+        
+        self._reader_slot.size = (width * 0.6, _DP8)
+        self._reader_slot.pos = (cx - width * 0.3, cy - _DP4)
+    
+    def _create_fingerprint_scanner(self, group):
+        """Create retained fingerprint scanner instructions"""
         # Scanner base
-        Color(*Theme.get('surface_variant'))
-        base = Ellipse(
-            size=(widget.width * 0.9, widget.height * 0.9),
-            pos=(widget.center_x - widget.width * 0.45,
-                 widget.center_y - widget.height * 0.45)
-        )
+        group.add(Color(*Theme.get('surface_variant')))
+        self._fingerprint_base = Ellipse()
+        group.add(self._fingerprint_base)
         
         # Fingerprint pattern
-        Color(*Theme.get('outline'))
-        for i in range(4):
-            size_factor = 0.2 + i * 0.15
-            Line(
-                ellipse=(
-                    widget.center_x - widget.width * size_factor/2,
-                    widget.center_y - widget.height * size_factor/2,
-                    widget.width * size_factor,
-                    widget.height * size_factor
-                ),
-                width=ResponsiveUtils.responsive_dp(2)
-            )
\ No newline at end of file
+        group.add(Color(*Theme.get('outline')))
+        self._fingerprint_rings = []
+        for size_factor in self.FINGERPRINT_RING_FACTORS:
+            ring = Line(width=_DP2)
+            group.add(ring)
+            self._fingerprint_rings.append((ring, size_factor))
+    
+    def _sync_fingerprint_scanner(self, widget):
+        """Fit the retained fingerprint instructions to the widget"""
+        cx, cy = widget.center
+        width, height = widget.size
+        
+        self._fingerprint_base.size = (width * 0.9, height * 0.9)
+        self._fingerprint_base.pos = (cx - width * 0.45, cy - height * 0.45)
+        
+        line_width = _DP2
+        for ring, size_factor in self._fingerprint_rings:
+            ring.ellipse = (
+                cx - width * size_factor/2,
+                cy - height * size_factor/2,
+                width * size_factor,
+                height * size_factor
+            )
+            ring.width = line_width
@@ -14,10 +14,14 @@ Features:
 """
 
 import os
+import re
+import time
+import functools
+import weakref
+from types import MappingProxyType
+from collections import namedtuple
 from datetime import datetime, timedelta
-from kivy.utils import get_color_from_hex
 from kivy.metrics import dp, sp
-from kivy.core.window import Window
 
 class Theme:
     """
@@ -27,62 +31,94 @@ class Theme:
     consistent color palettes, and dynamic theme switching.
     """
     
-    # Dark theme color palette (Material Design inspired)
-    DARK = {
-        'primary': get_color_from_hex('#2196F3'),          # Updated to Blue
-        'primary_dark': get_color_from_hex('#1976D2'),     # Updated to Darker Blue
-        'secondary': get_color_from_hex('#03DAC6'),        # Teal accent (unchanged)
-        'success': get_color_from_hex('#4CAF50'),          # Green (unchanged)
-        'warning': get_color_from_hex('#FF9800'),          # Orange (unchanged)
-        'error': get_color_from_hex('#F44336'),            # Updated to Red
-        'background': get_color_from_hex('#121212'),       # Dark background
-        'surface': get_color_from_hex('#1E1E1E'),          # Surface color
-        'surface_variant': get_color_from_hex('#2C2C2C'),  # Surface variant
-        'on_surface': get_color_from_hex('#FFFFFF'),       # Text on surface
-        'on_surface_variant': get_color_from_hex('#B0B0B0'), # Secondary text
-        'outline': get_color_from_hex('#404040'),          # Border color
-        'shadow': get_color_from_hex('#00000066'),         # Shadow color
-        'scan_bar': get_color_from_hex('#00FF41'),         # Scanning animation
-        'scan_bar_bg': get_color_from_hex('#001100'),      # Scan background
-    }
+    # Dark theme color palette (Material Design inspired), as read-only
+    # mappings of RGBA tuples
+    DARK = MappingProxyType({
+        'primary': (0.1294, 0.5882, 0.9529, 1.0),             # #2196F3 Updated to Blue
+        'primary_dark': (0.098, 0.4627, 0.8235, 1.0),         # #1976D2 Updated to Darker Blue
+        'secondary': (0.0118, 0.8549, 0.7765, 1.0),           # #03DAC6 Teal accent (unchanged)
+        'success': (0.298, 0.6863, 0.3137, 1.0),              # #4CAF50 Green (unchanged)
+        'warning': (1.0, 0.5961, 0.0, 1.0),                   # #FF9800 Orange (unchanged)
+        'error': (0.9569, 0.2627, 0.2118, 1.0),               # #F44336 Updated to Red
+        'background': (0.0706, 0.0706, 0.0706, 1.0),          # #121212 Dark background
+        'surface': (0.1176, 0.1176, 0.1176, 1.0),             # #1E1E1E Surface color
+        'surface_variant': (0.1725, 0.1725, 0.1725, 1.0),     # #2C2C2C Surface variant
+        'on_surface': (1.0, 1.0, 1.0, 1.0),                   # #FFFFFF Text on surface
+        'on_surface_variant': (0.6902, 0.6902, 0.6902, 1.0),  # #B0B0B0 Secondary text
+        'outline': (0.251, 0.251, 0.251, 1.0),                # #404040 Border color
+        'shadow': (0.0, 0.0, 0.0, 0.4),                       # #00000066 Shadow color
+        'scan_bar': (0.0, 1.0, 0.2549, 1.0),                  # #00FF41 Scanning animation
+        'scan_bar_bg': (0.0, 0.0667, 0.0, 1.0),               # #001100 Scan background
+    })
     
     # Light theme color palette 
-    LIGHT = {
-        'primary': get_color_from_hex('#2196F3'),          # Updated to Blue
-        'primary_dark': get_color_from_hex('#1976D2'),     # Updated to Darker Blue
-        'secondary': get_color_from_hex('#E3F2FD'),        # Light blue accent
-        'success': get_color_from_hex('#4CAF50'),          # Green (unchanged)
-        'warning': get_color_from_hex('#FF9800'),          # Orange (unchanged)
-        'error': get_color_from_hex('#F44336'),            # Red (unchanged)
-        'background': get_color_from_hex('#FAFAFA'),       # Light background
-        'surface': get_color_from_hex('#FFFFFF'),          # Surface color
-        'surface_variant': get_color_from_hex('#F5F5F5'),  # Surface variant
-        'on_surface': get_color_from_hex('#212121'),       # Text on surface
-        'on_surface_variant': get_color_from_hex('#757575'), # Secondary text
-        'outline': get_color_from_hex('#E0E0E0'),          # Border color
-        'shadow': get_color_from_hex('#00000029'),         # Shadow color
-        'scan_bar': get_color_from_hex('#4CAF50'),         # Scanning animation
-        'scan_bar_bg': get_color_from_hex('#E8F5E8'),      # Scan background
-    }
+    LIGHT = MappingProxyType({
+        'primary': (0.1294, 0.5882, 0.9529, 1.0),             # #2196F3 Updated to Blue
+        'primary_dark': (0.098, 0.4627, 0.8235, 1.0),         # #1976D2 Updated to Darker Blue
+        'secondary': (0.8902, 0.949, 0.9922, 1.0),            # #E3F2FD Light blue accent
+        'success': (0.298, 0.6863, 0.3137, 1.0),              # #4CAF50 Green (unchanged)
+        'warning': (1.0, 0.5961, 0.0, 1.0),                   # #FF9800 Orange (unchanged)
+        'error': (0.9569, 0.2627, 0.2118, 1.0),               # #F44336 Red (unchanged)
+        'background': (0.9804, 0.9804, 0.9804, 1.0),          # #FAFAFA Light background
+        'surface': (1.0, 1.0, 1.0, 1.0),                      # #FFFFFF Surface color
+        'surface_variant': (0.9608, 0.9608, 0.9608, 1.0),     # #F5F5F5 Surface variant
+        'on_surface': (0.1294, 0.1294, 0.1294, 1.0),          # #212121 Text on surface
+        'on_surface_variant': (0.4588, 0.4588, 0.4588, 1.0),  # #757575 Secondary text
+        'outline': (0.8784, 0.8784, 0.8784, 1.0),             # #E0E0E0 Border color
+        'shadow': (0.0, 0.0, 0.0, 0.1608),                    # #00000029 Shadow color
+        'scan_bar': (0.298, 0.6863, 0.3137, 1.0),             # #4CAF50 Scanning animation
+        'scan_bar_bg': (0.9098, 0.9608, 0.9098, 1.0),         # #E8F5E8 Scan background
+    })
          
+    # Color returned for unknown names
+    FALLBACK_COLOR = DARK['primary']
+    
     # Current active theme
     current_theme = DARK
     
+    # Immutable snapshot of the active palette (Theme.current.primary, ...)
+    Palette = namedtuple('Palette', DARK)
+    current = Palette(**DARK)
+    
+    # Weak references to callbacks run once per theme change
+    _listeners = []
+    
     @classmethod
     def toggle_theme(cls):
         """Toggle between dark and light themes"""
-        cls.current_theme = cls.LIGHT if cls.current_theme == cls.DARK else cls.DARK
-        return cls.current_theme == cls.DARK
+        cls.current_theme = cls.LIGHT if cls.current_theme is cls.DARK else cls.DARK
+        cls.current = cls.Palette(**cls.current_theme)
+        cls._notify_theme_change()
+        return cls.current_theme is cls.DARK
+    
+    @classmethod
+    def bind_theme_change(cls, callback):
+        """Register a bound method to be called after each theme change"""
+        cls._listeners.append(weakref.WeakMethod(callback))
+    
+    @classmethod
+    def _notify_theme_change(cls):
+        """Dispatch the theme change to live listeners, dropping dead ones"""
+        alive = []
+        for ref in cls._listeners:
+            callback = ref()
+            if callback is not None:
+                alive.append(ref)
+                callback()
+        cls._listeners = alive
     
     @classmethod
     def get(cls, color_name):
         """Get color value by name"""
-        return cls.current_theme.get(color_name, cls.DARK['primary'])
+        try:
+            return cls.current_theme[color_name]
+        except KeyError:
+            return cls.FALLBACK_COLOR
     
     @classmethod
     def is_dark(cls):
         """Check if current theme is dark mode"""
-        return cls.current_theme == cls.DARK
+        return cls.current_theme is cls.DARK
     
     @classmethod
     def get_theme_name(cls):
@@ -103,9 +139,23 @@ class ResponsiveUtils:
     BASE_BUTTON_HEIGHT = 65  # Increased from 55dp for better touch targets
     BASE_SPACING = 18        # Increased from 12dp for better visual separation
     
+    # Scale factor for the current window size (reset on resize)
+    _cached_scale = None
+    _resize_bound = False
+    
     @staticmethod
     def get_scale_factor():
         """Calculate responsive scale factor based on current window size"""
+        if ResponsiveUtils._cached_scale is not None:
+            return ResponsiveUtils._cached_scale
+        
+        # Import the window lazily so importing config does not create it
+        from kivy.core.window import Window
+        if not ResponsiveUtils._resize_bound:
+            # Responsive values depend on window size - recompute after every resize
+            Window.bind(on_resize=ResponsiveUtils.invalidate_cache)
+            ResponsiveUtils._resize_bound = True
+        
         screen_width = Window.width
         screen_height = Window.height
         base_width = 1280
@@ -115,82 +165,136 @@ class ResponsiveUtils:
         scale_y = screen_height / base_height
         
         # Use minimum scale to maintain aspect ratio, with slight boost
-        return min(scale_x, scale_y) * 1.1
+        ResponsiveUtils._cached_scale = min(scale_x, scale_y) * 1.1
+        return ResponsiveUtils._cached_scale
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def responsive_dp(base_dp):
         """Convert base dp value to responsive dp"""
         return dp(base_dp * ResponsiveUtils.get_scale_factor())
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def responsive_sp(base_sp):
         """Convert base sp value to responsive sp"""
         return sp(base_sp * ResponsiveUtils.get_scale_factor())
     
+    # Size multipliers (relative to the base sizes) per size type
+    FONT_SCALES = {
+        'tiny': 0.6,
+        'small': 0.8,
+        'normal': 1.0,
+        'medium': 1.2,
+        'large': 1.5,
+        'xlarge': 2.0,
+        'title': 2.5,
+        'hero': 3.0
+    }
+    ICON_SCALES = {
+        'tiny': 0.6,
+        'small': 0.8,
+        'normal': 1.0,
+        'medium': 1.5,
+        'large': 2.0,
+        'xlarge': 3.0,
+        'hero': 4.0
+    }
+    SPACING_SCALES = {
+        'tiny': 0.25,
+        'small': 0.5,
+        'normal': 1.0,
+        'medium': 1.5,
+        'large': 2.0,
+        'xlarge': 3.0,
+        'hero': 4.0
+    }
+    
+    # Base button dimensions (width, height) per size type
+    BUTTON_SIZES = {
+        'tiny': (80, 40),
+        'small': (120, 50),
+        'normal': (160, BASE_BUTTON_HEIGHT),
+        'medium': (200, 75),
+        'large': (300, 85),
+        'xlarge': (400, 95),
+        'hero': (500, 110)
+    }
+    
+    # Responsive size tables for the current scale factor (reset on resize)
+    _tables = None
+    
+    @staticmethod
+    def _get_tables():
+        """Build every responsive size table once per scale factor"""
+        tables = ResponsiveUtils._tables
+        if tables is None:
+            rdp = ResponsiveUtils.responsive_dp
+            rsp = ResponsiveUtils.responsive_sp
+            base = ResponsiveUtils
+            tables = {
+                'font': {name: rsp(base.BASE_FONT_SIZE * scale)
+                         for name, scale in base.FONT_SCALES.items()},
+                'icon': {name: rdp(base.BASE_ICON_SIZE * scale)
+                         for name, scale in base.ICON_SCALES.items()},
+                'button': {name: (rdp(width), rdp(height))
+                           for name, (width, height) in base.BUTTON_SIZES.items()},
+                'spacing': {name: rdp(base.BASE_SPACING * scale)
+                            for name, scale in base.SPACING_SCALES.items()}
+            }
+            ResponsiveUtils._tables = tables
+        return tables
+    
     @staticmethod
     def font_size(size_type='normal'):
         """Get responsive font size by type"""
-        sizes = {
-            'tiny': ResponsiveUtils.BASE_FONT_SIZE * 0.6,
-            'small': ResponsiveUtils.BASE_FONT_SIZE * 0.8,
-            'normal': ResponsiveUtils.BASE_FONT_SIZE,
-            'medium': ResponsiveUtils.BASE_FONT_SIZE * 1.2,
-            'large': ResponsiveUtils.BASE_FONT_SIZE * 1.5,
-            'xlarge': ResponsiveUtils.BASE_FONT_SIZE * 2.0,
-            'title': ResponsiveUtils.BASE_FONT_SIZE * 2.5,
-            'hero': ResponsiveUtils.BASE_FONT_SIZE * 3.0
-        }
-        return ResponsiveUtils.responsive_sp(sizes.get(size_type, sizes['normal']))
+        sizes = ResponsiveUtils._get_tables()['font']
+        return sizes.get(size_type, sizes['normal'])
     
     @staticmethod
     def icon_size(size_type='normal'):
         """Get responsive icon size by type"""
-        sizes = {
-            'tiny': ResponsiveUtils.BASE_ICON_SIZE * 0.6,
-            'small': ResponsiveUtils.BASE_ICON_SIZE * 0.8,
-            'normal': ResponsiveUtils.BASE_ICON_SIZE,
-            'medium': ResponsiveUtils.BASE_ICON_SIZE * 1.5,
-            'large': ResponsiveUtils.BASE_ICON_SIZE * 2.0,
-            'xlarge': ResponsiveUtils.BASE_ICON_SIZE * 3.0,
-            'hero': ResponsiveUtils.BASE_ICON_SIZE * 4.0
-        }
-        return ResponsiveUtils.responsive_dp(sizes.get(size_type, sizes['normal']))
+        sizes = ResponsiveUtils._get_tables()['icon']
+        return sizes.get(size_type, sizes['normal'])
     
     @staticmethod
     def button_size(size_type='normal'):
         """Get responsive button dimensions by type"""
-        base_height = ResponsiveUtils.BASE_BUTTON_HEIGHT
-        sizes = {
-            'tiny': (ResponsiveUtils.responsive_dp(80), ResponsiveUtils.responsive_dp(40)),
-            'small': (ResponsiveUtils.responsive_dp(120), ResponsiveUtils.responsive_dp(50)),
-            'normal': (ResponsiveUtils.responsive_dp(160), ResponsiveUtils.responsive_dp(base_height)),
-            'medium': (ResponsiveUtils.responsive_dp(200), ResponsiveUtils.responsive_dp(75)),
-            'large': (ResponsiveUtils.responsive_dp(300), ResponsiveUtils.responsive_dp(85)),
-            'xlarge': (ResponsiveUtils.responsive_dp(400), ResponsiveUtils.responsive_dp(95)),
-            'hero': (ResponsiveUtils.responsive_dp(500), ResponsiveUtils.responsive_dp(110))
-        }
+        sizes = ResponsiveUtils._get_tables()['button']
         return sizes.get(size_type, sizes['normal'])
     
     @staticmethod
     def spacing(size_type='normal'):
         """Get responsive spacing value by type"""
-        sizes = {
-            'tiny': ResponsiveUtils.BASE_SPACING * 0.25,
-            'small': ResponsiveUtils.BASE_SPACING * 0.5,
-            'normal': ResponsiveUtils.BASE_SPACING,
-            'medium': ResponsiveUtils.BASE_SPACING * 1.5,
-            'large': ResponsiveUtils.BASE_SPACING * 2.0,
-            'xlarge': ResponsiveUtils.BASE_SPACING * 3.0,
-            'hero': ResponsiveUtils.BASE_SPACING * 4.0
-        }
-        return ResponsiveUtils.responsive_dp(sizes.get(size_type, sizes['normal']))
+        sizes = ResponsiveUtils._get_tables()['spacing']
+        return sizes.get(size_type, sizes['normal'])
+    
+    # Callbacks run after cached values are dropped on resize
+    _resize_listeners = []
+    
+    @staticmethod
+    def add_resize_listener(callback):
+        """Register a callback to run after the responsive cache is reset"""
+        ResponsiveUtils._resize_listeners.append(callback)
+    
+    @staticmethod
+    def invalidate_cache(*args):
+        """Drop cached responsive values (called on window resize)"""
+        ResponsiveUtils._cached_scale = None
+        ResponsiveUtils._tables = None
+        ResponsiveUtils.responsive_dp.cache_clear()
+        ResponsiveUtils.responsive_sp.cache_clear()
+        
+        for callback in ResponsiveUtils._resize_listeners:
+            callback()
 
 class IconManager:
     """
     Professional icon management system
     
     Handles icon file loading, fallback text, and asset management
-    for a consistent visual experience.
+    for a consistent visual experience. Asset paths are resolved with
+    a single scan of the asset directories.
     """
     
     # Icon file mappings (support multiple formats)
@@ -247,44 +351,86 @@ class IconManager:
         'sun': '☀',
     }
     
+    # Fallback text for every known icon name (uppercased name if unmapped)
+    _FALLBACK_LOOKUP = {
+        **{name: name.upper() for name in ICON_MAPPINGS},
+        **FALLBACK_TEXT
+    }
+    
+    # Scanner device image mappings
+    SCANNER_MAPPINGS = {
+        'card': ['scanner-card.png', 'scanner-card.svg'],
+        'fingerprint': ['scanner-fingerprint.png', 'scanner-fingerprint.svg']
+    }
+    
+    # Directories searched for each asset kind, in priority order ('' = root)
+    ICON_DIRS = (os.path.join('assets', 'icons'), '')
+    SCANNER_DIRS = (os.path.join('assets', 'images'), '')
+    
+    # Resolved file paths by name, filled by scan_assets() on first use
+    _icon_paths = None
+    _scanner_paths = None
+    
+    @staticmethod
+    def _list_files(directory):
+        """Get the set of file names in a directory (empty if missing)"""
+        try:
+            with os.scandir(directory or '.') as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+    
+    @staticmethod
+    def _resolve_paths(mappings, directories, listings):
+        """Map each name to the first of its files found in the directories"""
+        # File name -> path, with earlier directories taking priority
+        by_name = {}
+        for directory in reversed(directories):
+            for file_name in listings[directory]:
+                by_name[file_name] = os.path.join(directory, file_name)
+        
+        resolved = {}
+        for name, file_names in mappings.items():
+            # Try each possible file format in order
+            for file_name in file_names:
+                path = by_name.get(file_name)
+                if path is not None:
+                    resolved[name] = path
+                    break
+        return resolved
+    
+    @classmethod
+    def scan_assets(cls):
+        """Scan the asset directories once and resolve all icon paths"""
+        # List each directory a single time, even when shared (the root)
+        listings = {
+            directory: cls._list_files(directory)
+            for directory in {*cls.ICON_DIRS, *cls.SCANNER_DIRS}
+        }
+        cls._icon_paths = cls._resolve_paths(cls.ICON_MAPPINGS, cls.ICON_DIRS, listings)
+        cls._scanner_paths = cls._resolve_paths(cls.SCANNER_MAPPINGS, cls.SCANNER_DIRS, listings)
+    
     @classmethod
     def get_icon_path(cls, icon_name):
         """Get the first available icon file path"""
-        if icon_name in cls.ICON_MAPPINGS:
-            # Try each possible file format
-            for icon_file in cls.ICON_MAPPINGS[icon_name]:
-                # Check in assets/icons/ directory first
-                assets_path = os.path.join('assets', 'icons', icon_file)
-                if os.path.exists(assets_path):
-                    return assets_path
-                # Check in root directory
-                if os.path.exists(icon_file):
-                    return icon_file
-        return None
+        if cls._icon_paths is None:
+            cls.scan_assets()
+        return cls._icon_paths.get(icon_name)
     
     @classmethod
     def get_fallback_text(cls, icon_name):
         """Get fallback text for icon"""
-        return cls.FALLBACK_TEXT.get(icon_name, icon_name.upper())
+        text = cls._FALLBACK_LOOKUP.get(icon_name)
+        if text is None:
+            text = icon_name.upper()
+        return text
     
     @classmethod
     def get_scanner_image(cls, scan_type):
         """Get scanner device image path"""
-        scanner_files = {
-            'card': ['scanner-card.png', 'scanner-card.svg'],
-            'fingerprint': ['scanner-fingerprint.png', 'scanner-fingerprint.svg']
-        }
-        
-        if scan_type in scanner_files:
-            for scanner_file in scanner_files[scan_type]:
-                # Check in assets/images/ directory first
-                assets_path = os.path.join('assets', 'images', scanner_file)
-                if os.path.exists(assets_path):
-                    return assets_path
-                # Check in root directory
-                if os.path.exists(scanner_file):
-                    return scanner_file
-        return None
+        if cls._scanner_paths is None:
+            cls.scan_assets()
+        return cls._scanner_paths.get(scan_type)
 
 class AppConfig:
     """
@@ -335,30 +481,50 @@ class AppConfig:
     LOG_LEVEL = "INFO"
     DEMO_MODE = False
     
+    # English day/month names for display formatting (strftime %A / %B)
+    DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday',
+                 'Friday', 'Saturday', 'Sunday')
+    MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                   'August', 'September', 'October', 'November', 'December')
+    
+    # Last formatted datetime string and the wall-clock second it was built for
+    _datetime_cache = (None, '')
+    
     @staticmethod
     def get_datetime_string():
         """Get current formatted datetime string"""
-        return datetime.now().strftime('%A, %B %d, %Y - %I:%M:%S %p')
+        second = int(time.time())
+        cached_second, cached_text = AppConfig._datetime_cache
+        if second == cached_second:
+            return cached_text
+        
+        now = datetime.fromtimestamp(second)
+        day_name = AppConfig.DAY_NAMES[now.weekday()]
+        text = f"{day_name}, {AppConfig.format_date(now)} - {AppConfig.format_time(now)}"
+        AppConfig._datetime_cache = (second, text)
+        return text
     
     @staticmethod
     def get_time_string():
         """Get current time string"""
-        return datetime.now().strftime('%I:%M:%S %p')
+        return AppConfig.format_time(datetime.now())
     
     @staticmethod
     def get_date_string():
         """Get current date string"""
-        return datetime.now().strftime('%B %d, %Y')
+        return AppConfig.format_date(datetime.now())
     
     @staticmethod
     def format_time(dt):
-        """Format datetime for display"""
-        return dt.strftime('%I:%M:%S %p')
+        """Format datetime for display (12-hour clock, e.g. 09:05:03 PM)"""
+        hour = dt.hour
+        period = 'AM' if hour < 12 else 'PM'
+        return f"{hour % 12 or 12:02d}:{dt.minute:02d}:{dt.second:02d} {period}"
     
     @staticmethod
     def format_date(dt):
-        """Format date for display"""  
-        return dt.strftime('%B %d, %Y')
+        """Format date for display (e.g. March 07, 2024)"""
+        return f"{AppConfig.MONTH_NAMES[dt.month - 1]} {dt.day:02d}, {dt.year}"
     
     @classmethod
     def get_version_info(cls):
@@ -373,14 +539,31 @@ class SessionState:
     and session lifecycle for continuous operation.
     """
     
-    _instance = None
-    
-    def __new__(cls):
-        """Singleton pattern implementation"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.reset()
-        return cls._instance
+    # Cabinet key names by slot (shared read-only role templates)
+    KEY_NAMES = MappingProxyType({
+        1: "Main Office Entrance",
+        2: "Server Room A-1",
+        3: "Lab Section 3B",
+        4: "Storage Unit #7",
+        5: "Conference Room 1",
+        6: "Data Center Main",
+        7: "Research Lab G",
+        8: "Executive Office",
+    })
+    
+    # Username words that grant supervisor access to all keys
+    ADMIN_ROLES = frozenset({'supervisor', 'admin', 'manager'})
+    
+    # Keys accessible to standard (non-supervisor) users
+    STANDARD_KEYS = MappingProxyType({
+        1: KEY_NAMES[1],
+        5: KEY_NAMES[5],
+        4: KEY_NAMES[4],
+    })
+    
+    def __init__(self):
+        """Initialize an empty session"""
+        self.reset()
     
     def reset(self):
         """Reset session to initial state"""
@@ -389,12 +572,14 @@ class SessionState:
         self.activity_code = None
         self.authentication_method = None
         self.session_active = False
-        self.accessible_keys = []
+        self._key_names = {}
+        self._key_status = {}
         self.removed_keys = []
         self.returned_keys = []
         self.failed_attempts = 0
         self.theme_changed = False
         self.session_id = None
+        self._expiry_ts = 0.0
     
     def start_session(self, username, auth_method='unknown'):
         """Start a new user session"""
@@ -402,7 +587,12 @@ class SessionState:
         self.authentication_method = auth_method
         self.login_time = datetime.now()
         self.session_active = True
-        self.session_id = f"{username}_{self.login_time.strftime('%Y%m%d_%H%M%S')}"
+        t = self.login_time
+        self.session_id = (
+            f"{username}_{t.year:04d}{t.month:02d}{t.day:02d}"
+            f"_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        )
+        self._expiry_ts = time.monotonic() + AppConfig.SESSION_TIMEOUT_MINUTES * 60
         self.failed_attempts = 0
         self.load_accessible_keys()
         
@@ -411,58 +601,58 @@ class SessionState:
     def load_accessible_keys(self):
         """Load keys accessible to current user based on role"""
         if not self.current_user:
-            self.accessible_keys = []
+            self._key_names = {}
+            self._key_status = {}
             return
             
-        user_lower = str(self.current_user).lower()
+        # Match whole words of the username (e.g. "admin_jane", "Site Manager")
+        user_tokens = set(re.split(r'[^a-z0-9]+', str(self.current_user).lower()))
         
-        if any(role in user_lower for role in ['supervisor', 'admin', 'manager']):
+        if not user_tokens.isdisjoint(self.ADMIN_ROLES):
             # Supervisor/Admin access - all keys
-            self.accessible_keys = [
-                {"name": "Main Office Entrance", "slot": 1, "status": "available"},
-                {"name": "Server Room A-1", "slot": 2, "status": "available"},
-                {"name": "Lab Section 3B", "slot": 3, "status": "available"},
-                {"name": "Storage Unit #7", "slot": 4, "status": "available"},
-                {"name": "Conference Room 1", "slot": 5, "status": "available"},
-                {"name": "Data Center Main", "slot": 6, "status": "available"},
-                {"name": "Research Lab G", "slot": 7, "status": "available"},
-                {"name": "Executive Office", "slot": 8, "status": "available"},
-            ]
+            self._key_names = self.KEY_NAMES
         else:
             # Standard user access - limited keys
-            self.accessible_keys = [
-                {"name": "Main Office Entrance", "slot": 1, "status": "available"},
-                {"name": "Conference Room 1", "slot": 5, "status": "available"},
-                {"name": "Storage Unit #7", "slot": 4, "status": "available"},
-            ]
+            self._key_names = self.STANDARD_KEYS
+        
+        # Only the per-session status is allocated
+        self._key_status = dict.fromkeys(self._key_names, "available")
+    
+    @property
+    def accessible_keys(self):
+        """Get accessible keys as name/slot/status records"""
+        return [
+            {"name": name, "slot": slot, "status": self._key_status[slot]}
+            for slot, name in self._key_names.items()
+        ]
     
     def remove_key(self, slot):
         """Remove a key from the cabinet"""
-        for key in self.accessible_keys:
-            if key["slot"] == slot and key["status"] == "available":
-                key["status"] = "removed"
-                self.removed_keys.append({
-                    "name": key["name"],
-                    "slot": slot,
-                    "time_removed": datetime.now(),
-                    "session_id": self.session_id
-                })
-                return True
-        return False
+        if self._key_status.get(slot) != "available":
+            return False
+        
+        self._key_status[slot] = "removed"
+        self.removed_keys.append({
+            "name": self._key_names[slot],
+            "slot": slot,
+            "time_removed": datetime.now(),
+            "session_id": self.session_id
+        })
+        return True
     
     def return_key(self, slot):
         """Return a key to the cabinet"""
-        for key in self.accessible_keys:
-            if key["slot"] == slot and key["status"] == "removed":
-                key["status"] = "available"
-                self.returned_keys.append({
-                    "name": key["name"],
-                    "slot": slot,
-                    "time_returned": datetime.now(),
-                    "session_id": self.session_id
-                })
-                return True
-        return False
+        if self._key_status.get(slot) != "removed":
+            return False
+        
+        self._key_status[slot] = "available"
+        self.returned_keys.append({
+            "name": self._key_names[slot],
+            "slot": slot,
+            "time_returned": datetime.now(),
+            "session_id": self.session_id
+        })
+        return True
     
     def end_session(self):
         """End current session and return summary"""
@@ -482,8 +672,9 @@ class SessionState:
             "activity_code": self.activity_code,
             "keys_removed": len(self.removed_keys),
             "keys_returned": len(self.returned_keys),
-            "removed_keys": self.removed_keys.copy(),
-            "returned_keys": self.returned_keys.copy(),
+            # Hand the lists over; reset() below starts fresh ones
+            "removed_keys": self.removed_keys,
+            "returned_keys": self.returned_keys,
             "failed_attempts": self.failed_attempts
         }
         
@@ -501,10 +692,8 @@ class SessionState:
     
     def is_session_expired(self):
         """Check if session has expired"""
-        if not self.session_active:
-            return True
-        duration = self.get_session_duration()
-        return duration.total_seconds() > (AppConfig.SESSION_TIMEOUT_MINUTES * 60)
+        return not self.session_active or time.monotonic() > self._expiry_ts
 
-# Global application state instance
+# Global application state instance - import this rather than creating
+# another SessionState
 app_state = SessionState()
\ No newline at end of file
@@ -12,9 +12,21 @@ Features:
 - Error recovery and validation
 """
 
+import importlib
+import logging
+from collections import Counter, deque, namedtuple
+from functools import partial
 from kivy.uix.screenmanager import ScreenManager, SlideTransition, FadeTransition
 from kivy.clock import Clock
-from core.config import AppConfig, app_state
+from core.config import AppConfig, Theme, app_state
+
+log = logging.getLogger('ams.nav')
+
+# Registered screen with its optional lifecycle hooks resolved once (None if absent)
+ScreenEntry = namedtuple('ScreenEntry', ('screen', 'on_enter', 'on_exit', 'refresh', 'theme_change', 'cleanup'))
+
+# Single navigation history record
+NavEvent = namedtuple('NavEvent', ('from_screen', 'to_screen', 'timestamp', 'session_id'))
 
 class NavigationManager:
     """
@@ -24,11 +36,33 @@ class NavigationManager:
     transition control, and screen lifecycle management.
     """
     
+    # Number of navigations kept in history (oldest dropped first)
+    HISTORY_SIZE = 50
+    
+    # Failed attempts before the user is sent back to method selection
+    MAX_FAILED_ATTEMPTS = AppConfig.MAX_PIN_ATTEMPTS
+    
     def __init__(self):
         """Initialize navigation manager"""
         self.screen_manager = ScreenManager()
-        self.navigation_history = []
+        self.navigation_history = deque(maxlen=self.HISTORY_SIZE)
         self.screen_registry = {}
+        self._registry_entries = {}
+        
+        # Names of screens added to the screen manager
+        self._registered_names = set()
+        
+        # Screens constructed on first use: name -> (module path, class name)
+        self._lazy_screens = {}
+        
+        # Active screen, kept in sync with the screen manager's current
+        self._active_screen_name = None
+        self._active_screen = None
+        self._active_entry = None
+        
+        # Screen left by the last successful navigation (target of go_back)
+        self._previous_screen = None
+        self.screen_manager.fbind('current', self._on_current_changed)
         
         # Configure default transitions
         self.setup_transitions()
@@ -36,94 +70,140 @@ class NavigationManager:
         # Navigation validation rules
         self.navigation_rules = self._setup_navigation_rules()
         
-        print("NavigationManager initialized")
+        # Rebuild screens once per theme change
+        Theme.bind_theme_change(self.refresh_all_screens)
+        
+        log.debug("NavigationManager initialized")
     
     def setup_transitions(self):
         """Setup screen transition animations"""
-        # Default smooth slide transition
-        self.screen_manager.transition = SlideTransition(
-            direction='left',
-            duration=AppConfig.TRANSITION_DURATION
+        # Build each transition once and swap them by assignment
+        self._slide_transitions = {
+            direction: SlideTransition(
+                direction=direction,
+                duration=AppConfig.TRANSITION_DURATION
+            )
+            for direction in ('left', 'right', 'up', 'down')
+        }
+        self._fade_transition = FadeTransition(
+            duration=AppConfig.FADE_DURATION
         )
+        
+        # Default smooth slide transition
+        self.screen_manager.transition = self._slide_transitions['left']
     
     def _setup_navigation_rules(self):
         """Setup navigation validation rules"""
         return {
             # Define allowed navigation paths
-            'main_idle': ['auth_selection', 'emergency_access', 'configuration'],
-            'auth_selection': ['main_idle', 'card_scan', 'biometric_scan'],
-            'card_scan': ['auth_selection', 'pin_entry'],
-            'biometric_scan': ['auth_selection', 'pin_entry'], 
-            'pin_entry': ['card_scan', 'biometric_scan', 'activity_code'],
-            'activity_code': ['pin_entry', 'main_idle'],
-            'emergency_access': ['main_idle'],
-            'configuration': ['main_idle']
+            'main_idle': frozenset({'auth_selection', 'emergency_access', 'configuration'}),
+            'auth_selection': frozenset({'main_idle', 'card_scan', 'biometric_scan'}),
+            'card_scan': frozenset({'auth_selection', 'pin_entry'}),
+            'biometric_scan': frozenset({'auth_selection', 'pin_entry'}),
+            'pin_entry': frozenset({'card_scan', 'biometric_scan', 'activity_code'}),
+            'activity_code': frozenset({'pin_entry', 'main_idle'}),
+            'emergency_access': frozenset({'main_idle'}),
+            'configuration': frozenset({'main_idle'})
         }
     
     def add_screen(self, screen):
         """Add a screen to the navigation system"""
         if hasattr(screen, 'name') and screen.name:
-            self.screen_manager.add_widget(screen)
+            # Register first: adding the first screen makes it current
             self.screen_registry[screen.name] = screen
+            self._registry_entries[screen.name] = ScreenEntry(
+                screen,
+                getattr(screen, 'on_screen_enter', None),
+                getattr(screen, 'on_screen_exit', None),
+                getattr(screen, 'refresh_layout', None),
+                getattr(screen, 'handle_theme_change', None),
+                getattr(screen, 'cleanup', None)
+            )
+            self.screen_manager.add_widget(screen)
+            self._registered_names.add(screen.name)
             
             # Set navigation manager reference in screen
-            if hasattr(screen, 'set_navigation_manager'):
-                screen.set_navigation_manager(self)
+            set_navigation_manager = getattr(screen, 'set_navigation_manager', None)
+            if set_navigation_manager:
+                set_navigation_manager(self)
                 
-            print(f"Screen registered: {screen.name}")
+            log.debug("Screen registered: %s", screen.name)
         else:
-            print(f"Warning: Screen {screen.__class__.__name__} has no name attribute")
+            log.warning("Screen %s has no name attribute", screen.__class__.__name__)
+    
+    def add_lazy_screen(self, screen_name, module_name, class_name):
+        """Register a screen that is imported and built on first use"""
+        self._lazy_screens[screen_name] = (module_name, class_name)
+    
+    def _load_lazy_screen(self, screen_name):
+        """Import, construct and register a deferred screen"""
+        module_name, class_name = self._lazy_screens.pop(screen_name)
+        screen_class = getattr(importlib.import_module(module_name), class_name)
+        self.add_screen(screen_class(name=screen_name))
+        return self.screen_registry.get(screen_name)
     
     def get_screen(self, screen_name):
         """Get screen by name"""
-        return self.screen_registry.get(screen_name)
+        screen = self.screen_registry.get(screen_name)
+        if screen is None and screen_name in self._lazy_screens:
+            screen = self._load_lazy_screen(screen_name)
+        return screen
+    
+    def _on_current_changed(self, screen_manager, screen_name):
+        """Track the active screen whenever the screen manager switches"""
+        self._active_screen_name = screen_name
+        self._active_entry = self._registry_entries.get(screen_name)
+        self._active_screen = self._active_entry.screen if self._active_entry else None
     
     def get_current_screen(self):
         """Get currently active screen"""
-        if hasattr(self.screen_manager, 'current_screen'):
-            return self.screen_manager.current_screen
-        return None
+        return self._active_screen
     
     def get_current_screen_name(self):
         """Get name of currently active screen"""
-        return self.screen_manager.current
+        return self._active_screen_name
     
     def set_current(self, screen_name, direction='left'):
         """Navigate to specified screen with validation"""
-        current_screen = self.get_current_screen_name()
+        current_screen = self._active_screen_name
         
         # Validate navigation
         if not self._validate_navigation(current_screen, screen_name):
-            print(f"Navigation blocked: {current_screen} -> {screen_name}")
+            log.info("Navigation blocked: %s -> %s", current_screen, screen_name)
             return False
         
         # Set transition direction
-        if direction:
-            self.screen_manager.transition.direction = direction
+        if direction and self.screen_manager.transition is not self._fade_transition:
+            self._use_transition(self._slide_transitions[direction])
         
         # Record navigation history
         self._record_navigation(current_screen, screen_name)
         
         # Perform navigation
         try:
+            # Build deferred screens on first visit
+            if screen_name in self._lazy_screens:
+                self._load_lazy_screen(screen_name)
+            
             # Notify current screen of exit
-            current_screen_obj = self.get_current_screen()
-            if current_screen_obj and hasattr(current_screen_obj, 'on_screen_exit'):
-                current_screen_obj.on_screen_exit()
+            current_entry = self._active_entry
+            if current_entry and current_entry.on_exit:
+                current_entry.on_exit()
             
             # Navigate to new screen
             self.screen_manager.current = screen_name
             
             # Notify new screen of entry
-            new_screen_obj = self.get_screen(screen_name)
-            if new_screen_obj and hasattr(new_screen_obj, 'on_screen_enter'):
-                new_screen_obj.on_screen_enter()
+            new_entry = self._active_entry
+            if new_entry and new_entry.on_enter:
+                new_entry.on_enter()
             
-            print(f"Navigation successful: {current_screen} -> {screen_name}")
+            self._previous_screen = current_screen
+            log.debug("Navigation successful: %s -> %s", current_screen, screen_name)
             return True
             
         except Exception as e:
-            print(f"Navigation error: {e}")
+            log.error("Navigation error: %s", e)
             return False
     
     def _validate_navigation(self, from_screen, to_screen):
@@ -142,31 +222,20 @@ class NavigationManager:
     
     def _record_navigation(self, from_screen, to_screen):
         """Record navigation in history"""
-        navigation_event = {
-            'from': from_screen,
-            'to': to_screen,
-            'timestamp': app_state.current_user if hasattr(app_state, 'current_user') else 'system',
-            'session_id': app_state.session_id if hasattr(app_state, 'session_id') else None
-        }
+        navigation_event = NavEvent(
+            from_screen,
+            to_screen,
+            app_state.current_user,
+            app_state.session_id
+        )
         
+        # Bounded ring buffer - appending drops the oldest entry when full
         self.navigation_history.append(navigation_event)
-        
-        # Keep history manageable (last 50 navigations)
-        if len(self.navigation_history) > 50:
-            self.navigation_history = self.navigation_history[-50:]
     
     def go_back(self):
         """Navigate back to previous screen"""
-        if len(self.navigation_history) >= 2:
-            # Get previous screen from history
-            previous_navigation = self.navigation_history[-2]
-            previous_screen = previous_navigation['from']
-            
-            # Navigate back with right direction
-            return self.set_current(previous_screen, direction='right')
-        else:
-            # Default to main screen if no history
-            return self.set_current('main_idle', direction='right')
+        # Default to main screen if there is no previous screen
+        return self.set_current(self._previous_screen or 'main_idle', direction='right')
     
     def go_home(self):
         """Navigate to main screen"""
@@ -186,14 +255,15 @@ class NavigationManager:
     
     def handle_authentication_failure(self, reason='invalid_credentials'):
         """Handle authentication failure"""
-        app_state.failed_attempts += 1
+        attempts = app_state.failed_attempts + 1
         
         # If too many failures, go back to auth selection
-        if app_state.failed_attempts >= AppConfig.MAX_PIN_ATTEMPTS:
+        if attempts >= self.MAX_FAILED_ATTEMPTS:
             app_state.failed_attempts = 0
             return self.set_current('auth_selection', direction='right')
         
         # Otherwise stay on current screen for retry
+        app_state.failed_attempts = attempts
         return False
     
     def complete_activity_session(self):
@@ -202,7 +272,7 @@ class NavigationManager:
         session_summary = app_state.end_session()
         
         if session_summary:
-            print(f"Session completed: {session_summary['session_id']}")
+            log.info("Session completed: %s", session_summary['session_id'])
         
         # Return to main screen
         return self.set_current('main_idle', direction='right')
@@ -220,10 +290,7 @@ class NavigationManager:
         if not self.navigation_history:
             return {"total_navigations": 0}
         
-        screen_visits = {}
-        for nav in self.navigation_history:
-            screen = nav['to']
-            screen_visits[screen] = screen_visits.get(screen, 0) + 1
+        screen_visits = Counter(nav.to_screen for nav in self.navigation_history)
         
         return {
             "total_navigations": len(self.navigation_history),
@@ -235,28 +302,42 @@ class NavigationManager:
     def set_transition_type(self, transition_type='slide', direction='left'):
         """Set screen transition type and direction"""
         if transition_type == 'slide':
-            self.screen_manager.transition = SlideTransition(
-                direction=direction,
-                duration=AppConfig.TRANSITION_DURATION
-            )
+            self._use_transition(self._slide_transitions[direction])
         elif transition_type == 'fade':
-            self.screen_manager.transition = FadeTransition(
-                duration=AppConfig.FADE_DURATION
-            )
+            self._use_transition(self._fade_transition)
         else:
-            print(f"Unknown transition type: {transition_type}")
+            log.warning("Unknown transition type: %s", transition_type)
+    
+    def _use_transition(self, transition):
+        """Switch to a prebuilt transition, finishing any running one first"""
+        current = self.screen_manager.transition
+        if current is transition:
+            return
+        
+        # The manager only stops its current transition, so an orphaned
+        # one would later remove the screen it was animating out
+        if current.is_active:
+            current.stop()
+        self.screen_manager.transition = transition
     
     def refresh_current_screen(self):
         """Refresh the current screen layout"""
-        current_screen = self.get_current_screen()
-        if current_screen and hasattr(current_screen, 'refresh_layout'):
-            Clock.schedule_once(lambda dt: current_screen.refresh_layout(), 0.1)
+        current_entry = self._active_entry
+        if current_entry and current_entry.refresh:
+            Clock.schedule_once(partial(self._do_refresh, current_entry.refresh), 0.1)
     
     def refresh_all_screens(self):
         """Refresh all registered screens (useful for theme changes)"""
-        for screen_name, screen in self.screen_registry.items():
-            if hasattr(screen, 'refresh_layout'):
-                Clock.schedule_once(lambda dt, s=screen: s.refresh_layout(), 0.1)
+        for entry in self._registry_entries.values():
+            # Screens with a theme hook defer offscreen rebuilds themselves
+            if entry.theme_change:
+                entry.theme_change()
+            elif entry.refresh:
+                Clock.schedule_once(partial(self._do_refresh, entry.refresh), 0.1)
+    
+    def _do_refresh(self, refresh, dt):
+        """Run a scheduled screen refresh"""
+        refresh()
     
     def cleanup(self):
         """Cleanup navigation manager"""
@@ -264,14 +345,16 @@ class NavigationManager:
         self.navigation_history.clear()
         
         # Notify all screens of cleanup
-        for screen_name, screen in self.screen_registry.items():
-            if hasattr(screen, 'cleanup'):
-                screen.cleanup()
+        for entry in self._registry_entries.values():
+            if entry.cleanup:
+                entry.cleanup()
         
         # Clear screen registry
         self.screen_registry.clear()
+        self._registry_entries.clear()
+        self._registered_names.clear()
         
-        print("NavigationManager cleaned up")
+        log.debug("NavigationManager cleaned up")
     
     def get_screen_hierarchy(self):
         """Get screen hierarchy for debugging"""
@@ -279,7 +362,7 @@ class NavigationManager:
         for screen_name in self.screen_registry:
             hierarchy[screen_name] = {
                 'class': self.screen_registry[screen_name].__class__.__name__,
-                'allowed_destinations': self.navigation_rules.get(screen_name, [])
+                'allowed_destinations': sorted(self.navigation_rules.get(screen_name, ()))
             }
         return hierarchy
     
@@ -288,10 +371,7 @@ class NavigationManager:
         issues = []
         
         # Check if all registered screens are in screen manager
-        sm_screens = {s.name for s in self.screen_manager.screens}
-        reg_screens = set(self.screen_registry.keys())
-        
-        if sm_screens != reg_screens:
+        if self._registered_names ^ self.screen_registry.keys():
             issues.append("Screen manager and registry mismatch")
         
         # Check current screen validity
@@ -300,13 +380,13 @@ class NavigationManager:
             issues.append(f"Current screen '{current}' not in registry")
         
         # Check navigation rules consistency
-        for screen, destinations in self.navigation_rules.items():
-            for dest in destinations:
-                if dest not in self.screen_registry:
-                    issues.append(f"Navigation rule references non-existent screen: {dest}")
+        all_destinations = frozenset().union(*self.navigation_rules.values())
+        missing = all_destinations - self.screen_registry.keys() - self._lazy_screens.keys()
+        if missing:
+            issues.append(f"Navigation rule references non-existent screens: {sorted(missing)}")
         
         if issues:
-            print(f"Screen integrity issues found: {issues}")
+            log.warning("Screen integrity issues found: %s", issues)
             return False
         
         return True
\ No newline at end of file
@@ -9,6 +9,11 @@
 # - Continuous operation support
 # - Production-ready deployment
 
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
 import kivy
 from kivy.app import App
 from kivy.core.window import Window
@@ -19,13 +24,26 @@ from kivy.clock import Clock
 from core.config import AppConfig, Theme
 from core.navigation import NavigationManager
 
-# Import screen modules  
+log = logging.getLogger('ams.app')
+
+# Import screen modules (other screens are imported on first navigation)
 from screens.main_screen import MainIdleScreen
-from screens.auth_screen import AuthSelectionScreen
-from screens.scan_screens import CardScanScreen, BiometricScanScreen
-from screens.input_screens import PinEntryScreen, ActivityCodeScreen
-from screens.emergency_screen import EmergencyAccessScreen
-from screens.config_screen import ConfigurationScreen
+
+# Screens built at startup: (screen class, screen name)
+_SCREEN_SPECS = (
+    (MainIdleScreen, 'main_idle'),
+)
+
+# Screens built on first use: (screen name, module, class name)
+_LAZY_SCREEN_SPECS = (
+    ('auth_selection', 'screens.auth_screen', 'AuthSelectionScreen'),
+    ('card_scan', 'screens.scan_screens', 'CardScanScreen'),
+    ('biometric_scan', 'screens.scan_screens', 'BiometricScanScreen'),
+    ('pin_entry', 'screens.input_screens', 'PinEntryScreen'),
+    ('activity_code', 'screens.input_screens', 'ActivityCodeScreen'),
+    ('emergency_access', 'screens.emergency_screen', 'EmergencyAccessScreen'),
+    ('configuration', 'screens.config_screen', 'ConfigurationScreen')
+)
 
 class AMSApp(App):
     """
@@ -45,33 +63,29 @@ class AMSApp(App):
         # Initialize navigation manager
         self.nav_manager = NavigationManager()
         
+        # Pending debounced resize refresh and screens awaiting a resize refresh
+        self._resize_pending = None
+        self._stale_screens = set()
+        
         # Register all screens
         self._register_screens()
         
         # Configure window properties
         self._configure_window()
         
-        # Setup continuous operation monitoring
-        Clock.schedule_interval(self._monitor_system_health, 1)
+        # Setup continuous operation monitoring on every screen change
+        self.nav_manager.screen_manager.fbind('current', self._monitor_system_health)
+        self.nav_manager.screen_manager.fbind('current', self._refresh_if_stale)
         
         return self.nav_manager.screen_manager
     
     def _register_screens(self):
         """Register all application screens with the navigation manager"""
-        screen_classes = [
-            (MainIdleScreen, 'main_idle'),
-            (AuthSelectionScreen, 'auth_selection'), 
-            (CardScanScreen, 'card_scan'),
-            (BiometricScanScreen, 'biometric_scan'),
-            (PinEntryScreen, 'pin_entry'),
-            (ActivityCodeScreen, 'activity_code'),
-            (EmergencyAccessScreen, 'emergency_access'),
-            (ConfigurationScreen, 'configuration')
-        ]
-        
-        for screen_class, screen_name in screen_classes:
-            screen = screen_class(name=screen_name)
-            self.nav_manager.add_screen(screen)
+        for screen_class, screen_name in _SCREEN_SPECS:
+            self.nav_manager.add_screen(screen_class(name=screen_name))
+        
+        for screen_name, module_name, class_name in _LAZY_SCREEN_SPECS:
+            self.nav_manager.add_lazy_screen(screen_name, module_name, class_name)
         
         # Set initial screen
         self.nav_manager.set_current('main_idle')
@@ -86,58 +100,90 @@ class AMSApp(App):
         
     def _handle_window_resize(self, window, width, height):
         """Handle window resize events for responsive design"""
-        # Refresh all screens to adapt to new size
+        # Coalesce a resize drag into one refresh once it settles
+        if self._resize_pending is not None:
+            self._resize_pending.cancel()
+        self._resize_pending = Clock.schedule_once(self._do_refresh_all, 0.15)
+    
+    def _do_refresh_all(self, dt):
+        """Refresh the current screen now and the others when next shown"""
+        self._resize_pending = None
+        current_screen = self.nav_manager.get_current_screen()
+        
         for screen in self.nav_manager.screen_manager.screens:
-            if hasattr(screen, 'refresh_layout'):
-                Clock.schedule_once(lambda dt, s=screen: s.refresh_layout(), 0.1)
+            if not hasattr(screen, 'refresh_layout'):
+                continue
+            if screen is current_screen:
+                screen.refresh_layout()
+            else:
+                self._stale_screens.add(screen.name)
+    
+    def _refresh_if_stale(self, screen_manager, screen_name):
+        """Refresh a screen that missed a resize while offscreen"""
+        if screen_name in self._stale_screens:
+            self._stale_screens.discard(screen_name)
+            screen_manager.get_screen(screen_name).refresh_layout()
     
-    def _monitor_system_health(self, dt):
+    def _monitor_system_health(self, screen_manager, screen_name):
         """Monitor system health for continuous operation"""
         # This enables continuous operation by monitoring:
         # - System state consistency
         # - Screen navigation health
         # - Auto-recovery from invalid states
         
-        if not hasattr(self.nav_manager, 'screen_manager'):
-            return
-            
         # Ensure we're always in a valid screen state
         current_screen = self.nav_manager.get_current_screen()
-        if not current_screen:
-            print("Warning: Invalid screen state detected, returning to main")
+        if not current_screen and screen_name != 'main_idle':
+            log.warning("Invalid screen state detected, returning to main")
             self.nav_manager.set_current('main_idle')
     
     def on_start(self):
         """Application startup initialization"""
-        print(f"\n{'='*70}")
-        print(f"{AppConfig.APP_NAME} {AppConfig.APP_VERSION} - Initializing...")
-        print(f"{'='*70}")
-        print(f"Theme: {'Dark' if Theme.is_dark() else 'Light'} Mode")
-        print(f"Screen Resolution: {Window.width}x{Window.height}")
-        print(f"Screens Registered: {len(self.nav_manager.screen_manager.screens)}")
-        
-                
+        log.info("%s %s - Initializing...", AppConfig.APP_NAME, AppConfig.APP_VERSION)
+        log.info("Theme: %s Mode", 'Dark' if Theme.is_dark() else 'Light')
+        log.info("Screen Resolution: %sx%s", Window.width, Window.height)
+        log.info("Screens Registered: %d", len(self.nav_manager.screen_manager.screens))
+        
         # Verify all screens loaded successfully
-        screen_names = [screen.name for screen in self.nav_manager.screen_manager.screens]
-        print(f"\nLoaded Screens: {', '.join(screen_names)}")
+        if log.isEnabledFor(logging.INFO):
+            screen_names = [screen.name for screen in self.nav_manager.screen_manager.screens]
+            log.info("Loaded Screens: %s", ', '.join(screen_names))
         
-        print(f"\n🚀 Application ready!")
-        print(f"{'='*70}\n")
+        log.info("Application ready")
     
     def on_stop(self):
         """Application shutdown cleanup"""
-        print(f"\n{AppConfig.APP_NAME} shutdown initiated...")
+        log.info("%s shutdown initiated...", AppConfig.APP_NAME)
         
         # Cleanup any active sessions
         if hasattr(self, 'nav_manager'):
             self.nav_manager.cleanup()
             
-        print(f"{AppConfig.APP_NAME} stopped gracefully")
-        print("Thank you for using AMS Touch Interface Professional!")
+        log.info("%s stopped gracefully", AppConfig.APP_NAME)
 
 def main():
     """Main application entry point"""
+    # Log records are queued on the UI thread and written by a listener thread
+    log_queue = queue.SimpleQueue()
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+    log_listener = QueueListener(log_queue, log_handler)
+    log_listener.start()
+    
     try:
+        # Configure the 'ams' logger directly: Kivy has already attached its
+        # handlers to the root logger, which makes logging.basicConfig a no-op
+        ams_log = logging.getLogger('ams')
+        
+        # Release builds log warnings only; set AMS_LOG_LEVEL=DEBUG to trace navigation
+        default_level = 'DEBUG' if AppConfig.DEBUG_MODE else 'WARNING'
+        ams_log.setLevel(os.environ.get('AMS_LOG_LEVEL', default_level).upper())
+        ams_log.addHandler(QueueHandler(log_queue))
+        ams_log.propagate = False
+        
+        # User action audit trail is always recorded
+        logging.getLogger('ams.audit').setLevel(logging.INFO)
+        
         # Configure Kivy settings before app creation
         Config.set('graphics', 'width', str(AppConfig.WINDOW_WIDTH))
         Config.set('graphics', 'height', str(AppConfig.WINDOW_HEIGHT))
@@ -157,6 +203,7 @@ def main():
         print("\nPlease check your installation and try again.")
     
     finally:
+        log_listener.stop()
         print("\nApplication terminated.")
 
 if __name__ == '__main__':
@@ -35,6 +35,23 @@ class AuthSelectionScreen(BaseScreen):
         """Create authentication selection layout"""
         self.clear_widgets()
         
+        # Resolve the repeated responsive sizes once per layout build
+        sizes = {
+            'option_height': ResponsiveUtils.responsive_dp(350),
+            'option_width': ResponsiveUtils.responsive_dp(280),
+            'option_spacing': ResponsiveUtils.spacing('medium'),
+            'button': (ResponsiveUtils.responsive_dp(250), ResponsiveUtils.responsive_dp(200)),
+            'text_width': ResponsiveUtils.responsive_dp(250),
+            'label_height': ResponsiveUtils.responsive_dp(40),
+            'description_height': ResponsiveUtils.responsive_dp(60)
+        }
+        
+        # Resolve the theme colors once per layout build
+        palette = {
+            'text': Theme.get('on_surface'),
+            'secondary_text': Theme.get('on_surface_variant')
+        }
+        
         # Main container
         layout = BoxLayout(
             orientation='vertical',
@@ -52,28 +69,24 @@ class AuthSelectionScreen(BaseScreen):
         )
         
         # Instructions section
-        instructions_section = self._create_instructions_section()
+        instructions_section = self._create_instructions_section(sizes, palette)
         
         # Authentication options
-        options_section = self._create_options_section()
+        options_section = self._create_options_section(sizes, palette)
         
-        # Assemble layout
+        # Assemble layout (sections share the free height, content top-aligned)
         layout.add_widget(header)
-        layout.add_widget(self.create_spacer(0.1))
         layout.add_widget(instructions_section)
-        layout.add_widget(self.create_spacer(0.2))
         layout.add_widget(options_section)
-        layout.add_widget(self.create_spacer(0.7))
         
         self.add_widget(layout)
         self.layout_created = True
     
-    def _create_instructions_section(self):
+    def _create_instructions_section(self, sizes, palette):
         """Create instructions for authentication selection"""
         instructions_section = BoxLayout(
             orientation='vertical',
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(80),
+            size_hint_y=0.3,
             spacing=ResponsiveUtils.spacing('small')
         )
         
@@ -81,154 +94,116 @@ class AuthSelectionScreen(BaseScreen):
         main_instruction = ResponsiveLabel(
             text='Please select your authentication method:',
             size_type='medium',
-            color=Theme.get('on_surface'),
+            color=palette['text'],
             halign='center',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(40)
+            height=sizes['label_height'],
+            text_size=(None, None)
         )
-        main_instruction.text_size = (None, None)
         
         # Secondary instruction
         secondary_instruction = ResponsiveLabel(
             text='Choose the method you have been authorized to use',
             size_type='normal',
-            color=Theme.get('on_surface_variant'),
+            color=palette['secondary_text'],
             halign='center',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(30)
+            height=ResponsiveUtils.responsive_dp(30),
+            text_size=(None, None)
         )
-        secondary_instruction.text_size = (None, None)
         
         instructions_section.add_widget(main_instruction)
         instructions_section.add_widget(secondary_instruction)
         
         return instructions_section
     
-    def _create_options_section(self):
+    def _create_options_section(self, sizes, palette):
         """Create authentication method options"""
         options_section = BoxLayout(
             orientation='horizontal',
             spacing=ResponsiveUtils.spacing('xlarge'),
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(350)
+            size_hint_y=0.7
         )
         
         # Center the options
         options_section.add_widget(Widget())
         
-        # Card authentication option
-        card_option = self._create_card_option()
-        
-        # Biometric authentication option
-        biometric_option = self._create_biometric_option()
+        # Authentication options differ only in their text and callback
+        option_specs = [
+            {
+                'text': 'CARD',
+                'icon': 'card',
+                'label': 'Card Access',
+                'desc': 'Use your authorized\\naccess card or badge',
+                'cb': self.select_card_auth
+            },
+            {
+                'text': 'SCAN',
+                'icon': 'fingerprint',
+                'label': 'Biometric Access',
+                'desc': 'Use your fingerprint\\nor biometric scanner',
+                'cb': self.select_biometric_auth
+            }
+        ]
         
-        options_section.add_widget(card_option)
-        options_section.add_widget(biometric_option)
+        for spec in option_specs:
+            options_section.add_widget(self._create_auth_option(spec, sizes, palette))
         options_section.add_widget(Widget())
         
         return options_section
     
-    def _create_card_option(self):
-        """Create card authentication option"""
-        card_option = BoxLayout(
-            orientation='vertical',
-            spacing=ResponsiveUtils.spacing('medium'),
-            size_hint_x=None,
-            width=ResponsiveUtils.responsive_dp(280)
-        )
-        
-        # Card button
-        card_button = ResponsiveButton(
-            text='CARD',
-            icon='card',
-            button_type='primary',
-            size_type='xlarge',
-            size=(ResponsiveUtils.responsive_dp(250), ResponsiveUtils.responsive_dp(200))
-        )
-        card_button.bind(on_press=self.select_card_auth)
-        
-        # Card label
-        card_label = ResponsiveLabel(
-            text='Card Access',
-            size_type='large',
-            bold=True,
-            color=Theme.get('on_surface'),
-            halign='center',
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(40)
-        )
-        card_label.text_size = (None, None)
-        
-        # Card description
-        card_description = ResponsiveLabel(
-            text='Use your authorized\\naccess card or badge',
-            size_type='normal',
-            color=Theme.get('on_surface_variant'),
-            halign='center',
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(60)
-        )
-        card_description.text_size = (ResponsiveUtils.responsive_dp(250), None)
-        
-        # Center the button
-        button_container = self.create_centered_container(card_button)
-        
-        card_option.add_widget(button_container)
-        card_option.add_widget(card_label)
-        card_option.add_widget(card_description)
-        
-        return card_option
-    
-    def _create_biometric_option(self):
-        """Create biometric authentication option"""
-        biometric_option = BoxLayout(
+    def _create_auth_option(self, spec, sizes, palette):
+        """Create a single authentication option from its spec"""
+        option = BoxLayout(
             orientation='vertical',
-            spacing=ResponsiveUtils.spacing('medium'),
-            size_hint_x=None,
-            width=ResponsiveUtils.responsive_dp(280)
+            spacing=sizes['option_spacing'],
+            size_hint=(None, None),
+            size=(sizes['option_width'], sizes['option_height']),
+            pos_hint={'top': 1}
         )
         
-        # Biometric button
-        biometric_button = ResponsiveButton(
-            text='SCAN',
-            icon='fingerprint',
+        # Option button
+        option_button = ResponsiveButton(
+            text=spec['text'],
+            icon=spec['icon'],
             button_type='primary',
             size_type='xlarge',
-            size=(ResponsiveUtils.responsive_dp(250), ResponsiveUtils.responsive_dp(200))
+            size_hint=(None, None),
+            size=sizes['button']
         )
-        biometric_button.bind(on_press=self.select_biometric_auth)
+        option_button.bind(on_press=spec['cb'])
         
-        # Biometric label
-        biometric_label = ResponsiveLabel(
-            text='Biometric Access',
+        # Option label
+        option_label = ResponsiveLabel(
+            text=spec['label'],
             size_type='large',
             bold=True,
-            color=Theme.get('on_surface'),
+            color=palette['text'],
             halign='center',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(40)
+            height=sizes['label_height'],
+            text_size=(None, None)
         )
-        biometric_label.text_size = (None, None)
         
-        # Biometric description
-        biometric_description = ResponsiveLabel(
-            text='Use your fingerprint\\nor biometric scanner',
+        # Option description
+        option_description = ResponsiveLabel(
+            text=spec['desc'],
             size_type='normal',
-            color=Theme.get('on_surface_variant'),
+            color=palette['secondary_text'],
             halign='center',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(60)
+            height=sizes['description_height'],
+            text_size=(sizes['text_width'], None)
         )
-        biometric_description.text_size = (ResponsiveUtils.responsive_dp(250), None)
         
         # Center the button
-        button_container = self.create_centered_container(biometric_button)
+        button_container = self.create_centered_container(option_button)
         
-        biometric_option.add_widget(button_container)
-        biometric_option.add_widget(biometric_label)
-        biometric_option.add_widget(biometric_description)
+        option.add_widget(button_container)
+        option.add_widget(option_label)
+        option.add_widget(option_description)
         
-        return biometric_option
+        return option
     
     def handle_back_pressed(self, button):
         """Handle back button press"""
@@ -13,15 +13,112 @@ Features:
 - Theme refresh capabilities
 """
 
+import logging
+
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.widget import Widget
 from kivy.graphics import Color, Rectangle
 from kivy.clock import Clock
 
-from core.config import Theme, ResponsiveUtils, AppConfig
+from core.config import Theme, ResponsiveUtils, AppConfig, app_state
 from components.widgets import ResponsiveButton, ResponsiveLabel, EnhancedPopup
 
+log = logging.getLogger('ams.screen')
+audit_log = logging.getLogger('ams.audit')
+
+class _BackgroundPainter:
+    """Themed background instructions reused across a screen's layout rebuilds"""
+    
+    def __init__(self):
+        self.color = Color(*Theme.current.background)
+        self.rect = Rectangle()
+        self.layout = None
+        self.active = True
+        
+        # Recolor in place when the theme changes
+        Theme.bind_theme_change(self.apply_theme)
+    
+    def attach(self, layout):
+        """Move the background onto a (re)built layout"""
+        self.detach()
+        
+        self.apply_theme()
+        
+        layout.canvas.before.clear()
+        layout.canvas.before.add(self.color)
+        layout.canvas.before.add(self.rect)
+        
+        self.layout = layout
+        layout.fbind('size', self._update_size)
+        layout.fbind('pos', self._update_pos)
+        self.update(layout)
+    
+    def apply_theme(self):
+        """Use the active palette's background color"""
+        self.color.rgba = Theme.current.background
+    
+    def detach(self):
+        """Remove the background from its current layout"""
+        if self.layout is not None:
+            self.layout.funbind('size', self._update_size)
+            self.layout.funbind('pos', self._update_pos)
+            self.layout.canvas.before.remove(self.color)
+            self.layout.canvas.before.remove(self.rect)
+            self.layout = None
+    
+    def update(self, layout, *args):
+        """Follow the layout geometry while the screen is shown"""
+        if self.active:
+            self.rect.size = layout.size
+            self.rect.pos = layout.pos
+    
+    def _update_size(self, layout, size):
+        """Resize the rectangle (size events only fire on real changes)"""
+        if self.active:
+            self.rect.size = size
+    
+    def _update_pos(self, layout, pos):
+        """Move the rectangle (pos events only fire on real changes)"""
+        if self.active:
+            self.rect.pos = pos
+    
+    def set_active(self, active):
+        """Pause geometry updates while the screen is offscreen"""
+        self.active = active
+        if active and self.layout is not None:
+            self.update(self.layout)
+
+class _ConfirmPopup(EnhancedPopup):
+    """Confirmation dialog whose callbacks are set per use"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.message_label = None
+        self.confirm_cb = None
+        self.cancel_cb = None
+    
+    def _on_cancel(self, button):
+        """Close and run the cancel callback"""
+        callback = self.cancel_cb
+        self.dismiss()
+        if callback:
+            callback()
+    
+    def _on_confirm(self, button):
+        """Close and run the confirm callback"""
+        callback = self.confirm_cb
+        self.dismiss()
+        if callback:
+            callback()
+    
+    def on_dismiss(self):
+        """Release the caller's callbacks however the dialog is closed"""
+        super().on_dismiss()
+        self.confirm_cb = None
+        self.cancel_cb = None
+
 class BaseScreen(Screen):
     """
     Professional base screen class for consistent functionality
@@ -44,8 +141,19 @@ class BaseScreen(Screen):
         self.is_active = False
         self.layout_created = False
         
-        # Background graphics reference
-        self.bg_rect = None
+        # Background graphics, reused whenever the layout is rebuilt
+        self._background = _BackgroundPainter()
+        self.bg_rect = self._background.rect
+        
+        # Coalesced next-frame layout refresh
+        self._trigger_refresh = Clock.create_trigger(self._do_refresh, -1)
+        
+        # Theme changed while offscreen - rebuild on next entry
+        self._theme_dirty = False
+        
+        # Last built header and the inputs it was built for
+        self._header_key = None
+        self._header = None
     
     def set_navigation_manager(self, nav_manager):
         """Set navigation manager reference"""
@@ -61,19 +169,12 @@ class BaseScreen(Screen):
         if not layout:
             return
             
-        layout.canvas.before.clear()
-        with layout.canvas.before:
-            Color(*Theme.get('background'))
-            self.bg_rect = Rectangle(size=layout.size, pos=layout.pos)
-        
-        # Bind to update background on layout changes
-        layout.bind(size=self.update_background, pos=self.update_background)
+        # Attach the screen's background and follow layout changes
+        self._background.attach(layout)
     
     def update_background(self, instance, value):
         """Update background rectangle when layout changes"""
-        if self.bg_rect:
-            self.bg_rect.size = instance.size
-            self.bg_rect.pos = instance.pos
+        self._background.update(instance)
     
     def create_header(self, title, back_button=True, back_callback=None):
         """
@@ -87,6 +188,14 @@ class BaseScreen(Screen):
         Returns:
             BoxLayout containing header elements
         """
+        # Reuse the header across layout rebuilds with the same look
+        key = (title, back_button, back_callback, Theme.current, ResponsiveUtils.get_scale_factor())
+        if key == self._header_key:
+            header = self._header
+            if header.parent:
+                header.parent.remove_widget(header)
+            return header
+        
         header = BoxLayout(
             orientation='horizontal',
             size_hint_y=None,
@@ -104,10 +213,7 @@ class BaseScreen(Screen):
             )
             
             # Use custom callback or default navigation
-            if back_callback:
-                back_btn.bind(on_press=back_callback)
-            else:
-                back_btn.bind(on_press=self.handle_back_navigation)
+            back_btn.fbind('on_press', back_callback or self.handle_back_navigation)
             
             header.add_widget(back_btn)
         
@@ -116,15 +222,52 @@ class BaseScreen(Screen):
             text=title,
             size_type='title',
             bold=True,
-            color=Theme.get('primary')
+            color=Theme.current.primary
         )
         header.add_widget(title_label)
         
         # Add spacer
         header.add_widget(Widget())
         
+        self._header_key = key
+        self._header = header
         return header
     
+    # Popups reused across screens, keyed by message type: (style key, popup)
+    _popup_pool = {}
+    
+    @staticmethod
+    def _pooled_popup(key, build):
+        """Get a closed pooled popup, rebuilding it if theme or scale changed"""
+        style = (Theme.current, ResponsiveUtils.get_scale_factor())
+        pooled = BaseScreen._popup_pool.get(key)
+        if pooled is not None and pooled[0] == style:
+            # Showing or still fading out: give this message its own popup
+            if pooled[1].parent is not None:
+                return build()
+            return pooled[1]
+        
+        popup = build()
+        BaseScreen._popup_pool[key] = (style, popup)
+        return popup
+    
+    @staticmethod
+    def _build_message_popup(msg_type):
+        """Build a message popup for the given type"""
+        # Create message content
+        content = ResponsiveLabel(
+            size_type='normal',
+            color=Theme.current.on_surface,
+            text_size=(ResponsiveUtils.responsive_dp(400), None),
+            halign='center',
+            valign='middle'
+        )
+        
+        return EnhancedPopup(
+            content=content,
+            popup_type=msg_type
+        )
+    
     def show_message(self, title, message, msg_type='info', auto_dismiss=3):
         """
         Show professional message popup with consistent styling
@@ -138,36 +281,18 @@ class BaseScreen(Screen):
         Returns:
             EnhancedPopup instance
         """
-        # Create message content
-        content = ResponsiveLabel(
-            text=message,
-            size_type='normal',
-            color=Theme.get('on_surface'),
-            text_size=(ResponsiveUtils.responsive_dp(400), None),
-            halign='center',
-            valign='middle'
-        )
+        popup = self._pooled_popup(msg_type, lambda: self._build_message_popup(msg_type))
         
-        # Create and show popup
-        popup = EnhancedPopup(
-            title=title,
-            content=content,
-            popup_type=msg_type,
-            auto_dismiss_time=auto_dismiss
-        )
+        # Fill in and show popup
+        popup.title = title
+        popup.content.text = message
+        popup.auto_dismiss_time = auto_dismiss
         popup.open()
         return popup
     
-    def show_confirmation(self, title, message, confirm_callback, cancel_callback=None):
-        """
-        Show confirmation dialog with Yes/No buttons
-        
-        Args:
-            title: Dialog title
-            message: Confirmation message
-            confirm_callback: Callback for confirm button
-            cancel_callback: Callback for cancel button (optional)
-        """
+    @staticmethod
+    def _build_confirmation_popup():
+        """Build the confirmation dialog with Yes/No buttons"""
         # Create content with buttons
         content_layout = BoxLayout(
             orientation='vertical',
@@ -176,9 +301,8 @@ class BaseScreen(Screen):
         
         # Message label
         msg_label = ResponsiveLabel(
-            text=message,
             size_type='normal',
-            color=Theme.get('on_surface'),
+            color=Theme.current.on_surface,
             text_size=(ResponsiveUtils.responsive_dp(400), None),
             halign='center'
         )
@@ -211,28 +335,36 @@ class BaseScreen(Screen):
         content_layout.add_widget(button_layout)
         
         # Create popup
-        popup = EnhancedPopup(
-            title=title,
+        popup = _ConfirmPopup(
             content=content_layout,
             popup_type='warning',
             auto_dismiss_time=0,
             size_hint=(0.6, 0.4)
         )
+        popup.message_label = msg_label
         
-        # Button callbacks
-        def on_cancel(btn):
-            popup.dismiss()
-            if cancel_callback:
-                cancel_callback()
+        cancel_btn.fbind('on_press', popup._on_cancel)
+        confirm_btn.fbind('on_press', popup._on_confirm)
         
-        def on_confirm(btn):
-            popup.dismiss()
-            if confirm_callback:
-                confirm_callback()
+        return popup
+    
+    def show_confirmation(self, title, message, confirm_callback, cancel_callback=None):
+        """
+        Show confirmation dialog with Yes/No buttons
         
-        cancel_btn.bind(on_press=on_cancel)
-        confirm_btn.bind(on_press=on_confirm)
+        Args:
+            title: Dialog title
+            message: Confirmation message
+            confirm_callback: Callback for confirm button
+            cancel_callback: Callback for cancel button (optional)
+        """
+        popup = self._pooled_popup('confirm', self._build_confirmation_popup)
         
+        # Fill in and show popup
+        popup.title = title
+        popup.message_label.text = message
+        popup.confirm_cb = confirm_callback
+        popup.cancel_cb = cancel_callback
         popup.open()
         return popup
     
@@ -241,7 +373,7 @@ class BaseScreen(Screen):
         if self.navigation_manager:
             self.navigation_manager.go_back()
         else:
-            print("Warning: No navigation manager available")
+            log.warning("No navigation manager available")
     
     def navigate_to(self, screen_name, direction='left'):
         """
@@ -254,7 +386,7 @@ class BaseScreen(Screen):
         if self.navigation_manager:
             self.navigation_manager.set_current(screen_name, direction)
         else:
-            print(f"Warning: Cannot navigate to {screen_name} - no navigation manager")
+            log.warning("Cannot navigate to %s - no navigation manager", screen_name)
     
     def navigate_home(self):
         """Navigate to main screen"""
@@ -265,10 +397,11 @@ class BaseScreen(Screen):
         Refresh screen layout (called on theme changes or window resize)
         Subclasses should override this method to recreate their layout
         """
-        if hasattr(self, 'create_layout'):
-            self.create_layout()
-        else:
-            print(f"Warning: {self.__class__.__name__} should implement create_layout() method")
+        self.create_layout()
+    
+    def create_layout(self):
+        """Build the screen layout (implemented by every screen)"""
+        log.warning("%s should implement create_layout() method", self.__class__.__name__)
     
     def on_screen_enter(self):
         """
@@ -276,7 +409,14 @@ class BaseScreen(Screen):
         Subclasses can override for screen-specific entry logic
         """
         self.is_active = True
-        print(f"Screen activated: {self.name}")
+        self._background.set_active(True)
+        
+        # Catch up on a theme change missed while offscreen
+        if self._theme_dirty:
+            self._theme_dirty = False
+            self.refresh_layout()
+        
+        log.debug("Screen activated: %s", self.name)
     
     def on_screen_exit(self):
         """
@@ -284,21 +424,21 @@ class BaseScreen(Screen):
         Subclasses can override for screen-specific exit logic
         """
         self.is_active = False
-        print(f"Screen deactivated: {self.name}")
+        self._background.set_active(False)
+        log.debug("Screen deactivated: %s", self.name)
     
     def cleanup(self):
         """
         Cleanup screen resources
         Subclasses can override for custom cleanup
         """
-        # Cancel any scheduled events
-        Clock.unschedule(self.update_background)
+        # Release the background bindings on the current layout
+        self._background.detach()
         
         # Clear graphics
-        if hasattr(self, 'bg_rect'):
-            self.bg_rect = None
+        self.bg_rect = None
         
-        print(f"Screen cleaned up: {self.name}")
+        log.debug("Screen cleaned up: %s", self.name)
     
     def get_screen_info(self):
         """Get screen information for debugging"""
@@ -312,7 +452,15 @@ class BaseScreen(Screen):
     
     def handle_theme_change(self):
         """Handle theme change by refreshing layout"""
-        Clock.schedule_once(lambda dt: self.refresh_layout(), 0.1)
+        # Offscreen screens are rebuilt when next shown
+        if self.is_active:
+            self._trigger_refresh()
+        else:
+            self._theme_dirty = True
+    
+    def _do_refresh(self, dt):
+        """Run a triggered layout refresh"""
+        self.refresh_layout()
     
     def create_spacer(self, size_hint_y=1.0):
         """Create a flexible spacer widget"""
@@ -327,10 +475,8 @@ class BaseScreen(Screen):
     
     def create_centered_container(self, widget):
         """Create a container that centers a widget horizontally"""
-        container = BoxLayout(orientation='horizontal')
-        container.add_widget(Widget())  # Left spacer
+        container = AnchorLayout(anchor_x='center')
         container.add_widget(widget)
-        container.add_widget(Widget())  # Right spacer
         return container
     
     def create_section_divider(self):
@@ -340,14 +486,20 @@ class BaseScreen(Screen):
             height=ResponsiveUtils.responsive_dp(1)
         )
         
-        def draw_divider(widget, *args):
-            widget.canvas.clear()
-            with widget.canvas:
-                Color(*Theme.get('outline'))
-                Rectangle(size=widget.size, pos=widget.pos)
+        # Draw once and only move the rectangle afterwards
+        with divider.canvas:
+            Color(*Theme.current.outline)
+            divider._rect = Rectangle(size=divider.size, pos=divider.pos)
+        
+        # Update only the property that changed
+        def resize_divider(widget, size):
+            widget._rect.size = size
+        
+        def move_divider(widget, pos):
+            widget._rect.pos = pos
         
-        divider.bind(size=draw_divider, pos=draw_divider)
-        Clock.schedule_once(lambda dt: draw_divider(divider), 0.1)
+        divider.fbind('size', resize_divider)
+        divider.fbind('pos', move_divider)
         
         return divider
     
@@ -359,26 +511,23 @@ class BaseScreen(Screen):
             action: Action description
             details: Additional details dictionary
         """
-        from core.config import app_state
-        
         log_entry = {
             'screen': self.name,
             'action': action,
-            'user': getattr(app_state, 'current_user', 'unknown'),
+            'user': app_state.current_user,
             'timestamp': AppConfig.get_datetime_string(),
             'details': details or {}
         }
         
-        # In production, this would write to a proper log file
-        print(f"User Action: {log_entry}")
+        # Audit records go through the queued 'ams.audit' logger
+        audit_log.info("User Action: %s", log_entry)
     
     def get_user_context(self):
         """Get current user context information"""
-        from core.config import app_state
-        
+        # Session fields are always defined by SessionState.reset()
         return {
-            'user': getattr(app_state, 'current_user', None),
-            'session_active': getattr(app_state, 'session_active', False),
-            'login_time': getattr(app_state, 'login_time', None),
-            'authentication_method': getattr(app_state, 'authentication_method', None)
+            'user': app_state.current_user,
+            'session_active': app_state.session_active,
+            'login_time': app_state.login_time,
+            'authentication_method': app_state.authentication_method
         }
\ No newline at end of file
@@ -16,11 +16,13 @@ from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.widget import Widget
+from kivy.clock import Clock
 from datetime import datetime
+from functools import partial
 
 from screens.base_screen import BaseScreen
 from core.config import ResponsiveUtils, Theme, AppConfig, app_state
-from components.widgets import ResponsiveButton, ResponsiveLabel, StatusIndicator
+from components.widgets import ResponsiveButton, ResponsiveLabel, StaticLabel, StatusIndicator
 
 class ConfigurationScreen(BaseScreen):
     """
@@ -34,20 +36,109 @@ class ConfigurationScreen(BaseScreen):
     - Comprehensive system information
     """
     
+    # Plain status rows: (label, value or callable resolved at build time)
+    STATUS_ITEMS = (
+        ('System Version:', AppConfig.get_version_info),
+        ('Site Location:', AppConfig.SITE_NAME),
+        ('Current Time:', AppConfig.get_datetime_string),
+        ('Theme Mode:', Theme.get_theme_name),
+        ('Last Restart:', 'System Boot')
+    )
+    
+    # Configuration sections: (title, ((text, action, icon), ...), content height)
+    SECTIONS = (
+        ('User Management', (
+            ('Add User', 'add_user', 'user'),
+            ('Edit Users', 'edit_users', 'config'),
+            ('Card Registration', 'card_registration', 'card'),
+            ('Biometric Setup', 'biometric_setup', 'fingerprint')
+        ), 80),
+        ('Device Settings', (
+            ('Display Settings', 'display_settings', 'sun'),
+            ('Network Config', 'network_config', 'network'),
+            ('Scanner Setup', 'scanner_setup', 'scan'),
+            ('Calibration', 'device_calibration', 'config')
+        ), 80),
+        ('Security Settings', (
+            ('Change PINs', 'change_pins', 'lock'),
+            ('Security Audit', 'security_audit', 'warning'),
+            ('Access Logs', 'access_logs', 'time'),
+            ('Backup Config', 'backup_config', 'success')
+        ), 80),
+        ('System Settings', (
+            ('Date/Time', 'datetime_settings', 'calendar'),
+            ('Language', 'language_settings', 'config'),
+            ('Timeouts', 'timeout_settings', 'time'),
+            ('Diagnostics', 'system_diagnostics', 'scan')
+        ), 80),
+        ('Maintenance', (
+            ('System Logs', 'system_logs', 'scan'),
+            ('Reset Settings', 'reset_settings', 'clear')
+        ), 40)
+    )
+    
+    # Not-yet-implemented actions: action -> (message title, message body)
+    PLACEHOLDERS = {
+        'add_user': ('Add User', 'User management features coming soon...'),
+        'edit_users': ('Edit Users', 'User editing features coming soon...'),
+        'card_registration': ('Card Registration', 'Card registration wizard coming soon...'),
+        'biometric_setup': ('Biometric Setup', 'Biometric enrollment features coming soon...'),
+        'display_settings': ('Display Settings', 'Display configuration options coming soon...'),
+        'network_config': ('Network Configuration', 'Network settings interface coming soon...'),
+        'scanner_setup': ('Scanner Setup', 'Scanner calibration tools coming soon...'),
+        'device_calibration': ('Device Calibration', 'Hardware calibration tools coming soon...'),
+        'change_pins': ('Change PINs', 'PIN management interface coming soon...'),
+        'security_audit': ('Security Audit', 'Security audit tools coming soon...'),
+        'access_logs': ('Access Logs', 'Access log viewer coming soon...'),
+        'backup_config': ('Backup Configuration', 'Configuration backup tools coming soon...'),
+        'datetime_settings': ('Date/Time Settings', 'Date and time configuration coming soon...'),
+        'language_settings': ('Language Settings', 'Multi-language support coming soon...'),
+        'timeout_settings': ('Timeout Settings', 'Session timeout configuration coming soon...'),
+        'system_diagnostics': ('System Diagnostics', 'Diagnostic tools coming soon...'),
+        'system_logs': ('System Logs', 'System log viewer coming soon...')
+    }
+    
+    # Actions whose buttons are styled as warnings
+    WARNING_ACTIONS = ('reset_settings',)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.config_sections = []
+        self.datetime_label = None
+        self._time_ev = None
+        self._root_layout = None
         self.create_layout()
     
     def create_layout(self):
         """Create configuration interface"""
-        self.clear_widgets()
+        # Drop only the previous layout tree when rebuilding
+        if self._root_layout is not None:
+            self.remove_widget(self._root_layout)
+        
+        # Resolve the repeated responsive sizes once per layout build
+        sizes = {
+            'spacing_small': ResponsiveUtils.spacing('small'),
+            'spacing_normal': ResponsiveUtils.spacing('normal'),
+            'spacing_medium': ResponsiveUtils.spacing('medium'),
+            'spacing_large': ResponsiveUtils.spacing('large'),
+            'status_height': ResponsiveUtils.responsive_dp(140),
+            'status_grid_height': ResponsiveUtils.responsive_dp(100),
+            'status_row_height': ResponsiveUtils.responsive_dp(30),
+            'status_item_height': ResponsiveUtils.responsive_dp(25),
+            'label_height': ResponsiveUtils.responsive_dp(40),
+            'scroll_height': ResponsiveUtils.responsive_dp(300),
+            'scroll_content_height': ResponsiveUtils.responsive_dp(500),
+            'button_row_height': ResponsiveUtils.responsive_dp(35),
+            'admin_height': ResponsiveUtils.responsive_dp(60)
+        }
+        
+        # Active palette snapshot; a theme change rebuilds the layout
+        palette = Theme.current
         
         # Main container
         layout = BoxLayout(
             orientation='vertical',
-            padding=ResponsiveUtils.spacing('large'),
-            spacing=ResponsiveUtils.spacing('medium')
+            padding=sizes['spacing_large'],
+            spacing=sizes['spacing_medium']
         )
         
         # Apply themed background
@@ -60,13 +151,13 @@ class ConfigurationScreen(BaseScreen):
         )
         
         # System status section
-        status_section = self._create_system_status_section()
+        status_section = self._create_system_status_section(sizes, palette)
         
         # Configuration options (scrollable)
-        config_scroll = self._create_configuration_scroll()
+        config_scroll = self._create_configuration_scroll(sizes, palette)
         
         # Admin actions section
-        admin_actions_section = self._create_admin_actions_section()
+        admin_actions_section = self._create_admin_actions_section(sizes)
         
         # Assemble layout
         layout.add_widget(header)
@@ -76,16 +167,17 @@ class ConfigurationScreen(BaseScreen):
         layout.add_widget(self.create_section_divider())
         layout.add_widget(admin_actions_section)
         
+        self._root_layout = layout
         self.add_widget(layout)
         self.layout_created = True
     
-    def _create_system_status_section(self):
+    def _create_system_status_section(self, sizes, palette):
         """Create system status overview"""
         status_section = BoxLayout(
             orientation='vertical',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(140),
-            spacing=ResponsiveUtils.spacing('small')
+            height=sizes['status_height'],
+            spacing=sizes['spacing_small']
         )
         
         # System info header
@@ -93,278 +185,188 @@ class ConfigurationScreen(BaseScreen):
             text='System Information',
             size_type='medium',
             bold=True,
-            color=Theme.get('primary'),
+            color=palette.primary,
             halign='center',
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(40)
+            height=sizes['label_height']
         )
         info_header.text_size = (None, None)
         
         # System status grid
         status_grid = GridLayout(
             cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
+            spacing=sizes['spacing_normal'],
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(100),
-            row_default_height=ResponsiveUtils.responsive_dp(30)
+            height=sizes['status_grid_height'],
+            row_default_height=sizes['status_row_height']
         )
         
-        # Status items
-        status_items = [
-            ('System Version:', AppConfig.get_version_info()),
-            ('Site Location:', AppConfig.SITE_NAME),
-            ('Current Time:', AppConfig.get_datetime_string()),
-            ('Theme Mode:', Theme.get_theme_name()),
-            ('System Status:', 'Operational'),
-            ('Last Restart:', 'System Boot')
-        ]
-        
-        for label, value in status_items:
-            # Label
-            label_widget = ResponsiveLabel(
-                text=label,
-                size_type='small',
-                color=Theme.get('on_surface_variant'),
-                size_hint_y=None,
-                height=ResponsiveUtils.responsive_dp(25)
-            )
+        for label, value in self.STATUS_ITEMS:
+            if callable(value):
+                value = value()
             
-            # Value with status indicator for some items
-            if label == 'System Status:':
-                value_container = BoxLayout(
-                    orientation='horizontal',
-                    spacing=ResponsiveUtils.spacing('small'),
-                    size_hint_y=None,
-                    height=ResponsiveUtils.responsive_dp(25)
-                )
-                
-                status_indicator = StatusIndicator(
-                    status='active',
-                    size_type='small'
-                )
-                
+            # Only the clock cell changes after the layout is built
+            if label == 'Current Time:':
                 value_widget = ResponsiveLabel(
                     text=value,
                     size_type='small',
-                    color=Theme.get('success'),
-                    bold=True
+                    color=palette.on_surface
                 )
-                
-                value_container.add_widget(status_indicator)
-                value_container.add_widget(value_widget)
-                status_grid.add_widget(label_widget)
-                status_grid.add_widget(value_container)
+                self.datetime_label = value_widget
             else:
-                value_widget = ResponsiveLabel(
+                value_widget = StaticLabel(
                     text=value,
                     size_type='small',
-                    color=Theme.get('on_surface')
+                    color=palette.on_surface
                 )
-                status_grid.add_widget(label_widget)
-                status_grid.add_widget(value_widget)
+            self._add_status_row(status_grid, label, value_widget, sizes, palette)
+        
+        # System status row with its indicator
+        value_container = BoxLayout(
+            orientation='horizontal',
+            spacing=sizes['spacing_small'],
+            size_hint_y=None,
+            height=sizes['status_item_height']
+        )
+        value_container.add_widget(StatusIndicator(
+            status='active',
+            size_type='small'
+        ))
+        value_container.add_widget(StaticLabel(
+            text='Operational',
+            size_type='small',
+            color=palette.success,
+            bold=True
+        ))
+        self._add_status_row(status_grid, 'System Status:', value_container, sizes, palette)
         
         status_section.add_widget(info_header)
         status_section.add_widget(status_grid)
         
         return status_section
     
-    def _create_configuration_scroll(self):
+    def _add_status_row(self, status_grid, label, value_widget, sizes, palette):
+        """Add a label and its value widget to the status grid"""
+        status_grid.add_widget(StaticLabel(
+            text=label,
+            size_type='small',
+            color=palette.on_surface_variant,
+            size_hint_y=None,
+            height=sizes['status_item_height']
+        ))
+        status_grid.add_widget(value_widget)
+    
+    def _create_configuration_scroll(self, sizes, palette):
         """Create scrollable configuration options"""
         # Scrollable container
         config_scroll = ScrollView(
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(300)
+            height=sizes['scroll_height']
         )
         
         # Configuration content
         config_content = BoxLayout(
             orientation='vertical',
-            spacing=ResponsiveUtils.spacing('medium'),
+            spacing=sizes['spacing_medium'],
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(500)  # Allow scrolling
+            height=sizes['scroll_content_height']  # Allow scrolling
         )
         
-        # Configuration sections
-        config_sections = [
-            ('User Management', self._create_user_management_section()),
-            ('Device Settings', self._create_device_settings_section()),
-            ('Security Settings', self._create_security_settings_section()),
-            ('System Settings', self._create_system_settings_section()),
-            ('Maintenance', self._create_maintenance_section())
-        ]
+        # Section contents are built the first time they scroll into view
+        self._pending_sections = []
         
-        for section_title, section_content in config_sections:
+        for section_title, items, content_height in self.SECTIONS:
             # Section header
             section_header = ResponsiveLabel(
                 text=section_title,
                 size_type='medium',
                 bold=True,
-                color=Theme.get('secondary'),
+                color=palette.secondary,
                 size_hint_y=None,
-                height=ResponsiveUtils.responsive_dp(40)
+                height=sizes['label_height']
+            )
+            
+            # Placeholder of the section's size until it is built
+            section_height = ResponsiveUtils.responsive_dp(content_height)
+            placeholder = Widget(
+                size_hint_y=None,
+                height=section_height
+            )
+            self._pending_sections.append(
+                (placeholder, partial(self._build_button_grid, items, sizes, section_height))
             )
             
             config_content.add_widget(section_header)
-            config_content.add_widget(section_content)
+            config_content.add_widget(placeholder)
             config_content.add_widget(self.create_fixed_spacer(10))
         
         config_scroll.add_widget(config_content)
-        return config_scroll
-    
-    def _create_user_management_section(self):
-        """Create user management options"""
-        user_section = GridLayout(
-            cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(80),
-            row_default_height=ResponsiveUtils.responsive_dp(35)
-        )
         
-        user_buttons = [
-            ('Add User', self.add_user, 'user'),
-            ('Edit Users', self.edit_users, 'config'),
-            ('Card Registration', self.card_registration, 'card'),
-            ('Biometric Setup', self.biometric_setup, 'fingerprint')
-        ]
+        # Check for newly visible sections once per frame while scrolling
+        self._config_scroll = config_scroll
+        self._trigger_section_build = Clock.create_trigger(self._build_visible_sections, -1)
+        config_scroll.fbind('scroll_y', self._trigger_section_build)
+        config_content.fbind('pos', self._trigger_section_build)
         
-        for btn_text, callback, icon in user_buttons:
-            btn = ResponsiveButton(
-                text=btn_text,
-                icon=icon,
-                button_type='secondary',
-                size_type='small'
-            )
-            btn.bind(on_press=callback)
-            user_section.add_widget(btn)
-        
-        return user_section
-    
-    def _create_device_settings_section(self):
-        """Create device configuration options"""
-        device_section = GridLayout(
-            cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(80),
-            row_default_height=ResponsiveUtils.responsive_dp(35)
-        )
-        
-        device_buttons = [
-            ('Display Settings', self.display_settings, 'sun'),
-            ('Network Config', self.network_config, 'network'),
-            ('Scanner Setup', self.scanner_setup, 'scan'),
-            ('Calibration', self.device_calibration, 'config')
-        ]
-        
-        for btn_text, callback, icon in device_buttons:
-            btn = ResponsiveButton(
-                text=btn_text,
-                icon=icon,
-                button_type='secondary',
-                size_type='small'
-            )
-            btn.bind(on_press=callback)
-            device_section.add_widget(btn)
-        
-        return device_section
-    
-    def _create_security_settings_section(self):
-        """Create security configuration options"""
-        security_section = GridLayout(
-            cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(80),
-            row_default_height=ResponsiveUtils.responsive_dp(35)
-        )
-        
-        security_buttons = [
-            ('Change PINs', self.change_pins, 'lock'),
-            ('Security Audit', self.security_audit, 'warning'),
-            ('Access Logs', self.access_logs, 'time'),
-            ('Backup Config', self.backup_config, 'success')
-        ]
-        
-        for btn_text, callback, icon in security_buttons:
-            btn = ResponsiveButton(
-                text=btn_text,
-                icon=icon,
-                button_type='secondary',
-                size_type='small'
-            )
-            btn.bind(on_press=callback)
-            security_section.add_widget(btn)
-        
-        return security_section
+        return config_scroll
     
-    def _create_system_settings_section(self):
-        """Create system configuration options"""
-        system_section = GridLayout(
-            cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(80),
-            row_default_height=ResponsiveUtils.responsive_dp(35)
-        )
-        
-        system_buttons = [
-            ('Date/Time', self.datetime_settings, 'calendar'),
-            ('Language', self.language_settings, 'config'),
-            ('Timeouts', self.timeout_settings, 'time'),
-            ('Diagnostics', self.system_diagnostics, 'scan')
-        ]
-        
-        for btn_text, callback, icon in system_buttons:
-            btn = ResponsiveButton(
-                text=btn_text,
-                icon=icon,
-                button_type='secondary',
-                size_type='small'
-            )
-            btn.bind(on_press=callback)
-            system_section.add_widget(btn)
+    def _build_visible_sections(self, *args):
+        """Replace placeholders that overlap the scroll viewport with their sections"""
+        scroll = self._config_scroll
+        pending = []
+        
+        for placeholder, builder in self._pending_sections:
+            if placeholder.top >= scroll.y and placeholder.y <= scroll.top:
+                content = placeholder.parent
+                index = content.children.index(placeholder)
+                content.remove_widget(placeholder)
+                content.add_widget(builder(), index=index)
+            else:
+                pending.append((placeholder, builder))
         
-        return system_section
+        self._pending_sections = pending
     
-    def _create_maintenance_section(self):
-        """Create maintenance options"""
-        maintenance_section = GridLayout(
+    def _build_button_grid(self, items, sizes, height):
+        """Create a two-column grid of configuration buttons"""
+        grid = GridLayout(
             cols=2,
-            spacing=ResponsiveUtils.spacing('normal'),
+            spacing=sizes['spacing_normal'],
             size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(40),
-            row_default_height=ResponsiveUtils.responsive_dp(35)
+            height=height,
+            row_default_height=sizes['button_row_height']
         )
         
-        maintenance_buttons = [
-            ('System Logs', self.system_logs, 'scan'),
-            ('Reset Settings', self.reset_settings, 'clear')
-        ]
+        # Resolve class tables and the shared handler once per grid
+        warning_actions = self.WARNING_ACTIONS
+        placeholders = self.PLACEHOLDERS
+        placeholder = self._placeholder
         
-        for btn_text, callback, icon in maintenance_buttons:
+        for btn_text, action, icon in items:
             btn = ResponsiveButton(
                 text=btn_text,
                 icon=icon,
-                button_type='warning' if 'reset' in btn_text.lower() else 'secondary',
+                button_type='warning' if action in warning_actions else 'secondary',
                 size_type='small'
             )
-            btn.bind(on_press=callback)
-            maintenance_section.add_widget(btn)
+            if action in placeholders:
+                btn.fbind('on_press', placeholder, action)
+            else:
+                btn.fbind('on_press', getattr(self, action))
+            grid.add_widget(btn)
         
-        return maintenance_section
+        return grid
     
-    def _create_admin_actions_section(self):
+    def _create_admin_actions_section(self, sizes):
         """Create administrative action buttons"""
+        # Sized to its buttons and centered by the parent layout
         admin_actions = BoxLayout(
             orientation='horizontal',
-            size_hint_y=None,
-            height=ResponsiveUtils.responsive_dp(60),
-            spacing=ResponsiveUtils.spacing('large')
+            size_hint=(None, None),
+            height=sizes['admin_height'],
+            spacing=sizes['spacing_large'],
+            pos_hint={'center_x': 0.5}
         )
         
-        admin_actions.add_widget(Widget())  # Left spacer
-        
         # Restart system button
         restart_btn = ResponsiveButton(
             text='RESTART SYSTEM',
@@ -372,7 +374,7 @@ class ConfigurationScreen(BaseScreen):
             button_type='warning',
             size_type='normal'
         )
-        restart_btn.bind(on_press=self.restart_system)
+        restart_btn.fbind('on_press', self.restart_system)
         
         # Factory reset button (dangerous)
         factory_reset_btn = ResponsiveButton(
@@ -381,11 +383,11 @@ class ConfigurationScreen(BaseScreen):
             button_type='error',
             size_type='normal'
         )
-        factory_reset_btn.bind(on_press=self.factory_reset)
+        factory_reset_btn.fbind('on_press', self.factory_reset)
         
         admin_actions.add_widget(restart_btn)
         admin_actions.add_widget(factory_reset_btn)
-        admin_actions.add_widget(Widget())  # Right spacer
+        admin_actions.width = restart_btn.width + factory_reset_btn.width + admin_actions.spacing
         
         return admin_actions
     
@@ -394,74 +396,11 @@ class ConfigurationScreen(BaseScreen):
         self.log_user_action('configuration_back_pressed')
         self.navigate_home()
     
-    # Configuration action methods
-    def add_user(self, button):
-        self.log_user_action('add_user_requested')
-        self.show_message('Add User', 'User management features coming soon...', 'info', 3)
-    
-    def edit_users(self, button):
-        self.log_user_action('edit_users_requested')
-        self.show_message('Edit Users', 'User editing features coming soon...', 'info', 3)
-    
-    def card_registration(self, button):
-        self.log_user_action('card_registration_requested')
-        self.show_message('Card Registration', 'Card registration wizard coming soon...', 'info', 3)
-    
-    def biometric_setup(self, button):
-        self.log_user_action('biometric_setup_requested')
-        self.show_message('Biometric Setup', 'Biometric enrollment features coming soon...', 'info', 3)
-    
-    def display_settings(self, button):
-        self.log_user_action('display_settings_requested')
-        self.show_message('Display Settings', 'Display configuration options coming soon...', 'info', 3)
-    
-    def network_config(self, button):
-        self.log_user_action('network_config_requested')
-        self.show_message('Network Configuration', 'Network settings interface coming soon...', 'info', 3)
-    
-    def scanner_setup(self, button):
-        self.log_user_action('scanner_setup_requested')
-        self.show_message('Scanner Setup', 'Scanner calibration tools coming soon...', 'info', 3)
-    
-    def device_calibration(self, button):
-        self.log_user_action('device_calibration_requested')
-        self.show_message('Device Calibration', 'Hardware calibration tools coming soon...', 'info', 3)
-    
-    def change_pins(self, button):
-        self.log_user_action('change_pins_requested')
-        self.show_message('Change PINs', 'PIN management interface coming soon...', 'info', 3)
-    
-    def security_audit(self, button):
-        self.log_user_action('security_audit_requested')
-        self.show_message('Security Audit', 'Security audit tools coming soon...', 'info', 3)
-    
-    def access_logs(self, button):
-        self.log_user_action('access_logs_requested')
-        self.show_message('Access Logs', 'Access log viewer coming soon...', 'info', 3)
-    
-    def backup_config(self, button):
-        self.log_user_action('backup_config_requested')
-        self.show_message('Backup Configuration', 'Configuration backup tools coming soon...', 'info', 3)
-    
-    def datetime_settings(self, button):
-        self.log_user_action('datetime_settings_requested')
-        self.show_message('Date/Time Settings', 'Date and time configuration coming soon...', 'info', 3)
-    
-    def language_settings(self, button):
-        self.log_user_action('language_settings_requested')
-        self.show_message('Language Settings', 'Multi-language support coming soon...', 'info', 3)
-    
-    def timeout_settings(self, button):
-        self.log_user_action('timeout_settings_requested')
-        self.show_message('Timeout Settings', 'Session timeout configuration coming soon...', 'info', 3)
-    
-    def system_diagnostics(self, button):
-        self.log_user_action('system_diagnostics_requested')
-        self.show_message('System Diagnostics', 'Diagnostic tools coming soon...', 'info', 3)
-    
-    def system_logs(self, button):
-        self.log_user_action('system_logs_requested')
-        self.show_message('System Logs', 'System log viewer coming soon...', 'info', 3)
+    def _placeholder(self, action, *args):
+        """Announce a configuration action that is not implemented yet"""
+        title, message = self.PLACEHOLDERS[action]
+        self.log_user_action(f'{action}_requested')
+        self.show_message(title, message, 'info', 3)
     
     def reset_settings(self, button):
         """Handle settings reset with confirmation"""
@@ -546,11 +485,36 @@ class ConfigurationScreen(BaseScreen):
         """Called when screen becomes active"""
         super().on_screen_enter()
         self.log_user_action('configuration_screen_entered')
+        
+        # Update the clock cell in place while the screen is visible
+        self.update_datetime(0)
+        if self._time_ev is None:
+            self._time_ev = Clock.schedule_interval(self.update_datetime, 1)
     
     def on_screen_exit(self):
         """Called when leaving screen"""
         super().on_screen_exit()
         self.log_user_action('configuration_screen_exited')
+        self._stop_clock()
+    
+    def update_datetime(self, dt):
+        """Update the current time in the status section"""
+        if self.datetime_label:
+            self.datetime_label.text = AppConfig.get_datetime_string()
+    
+    def _stop_clock(self):
+        """Cancel the clock cell updates, if running"""
+        if self._time_ev is not None:
+            self._time_ev.cancel()
+            self._time_ev = None
+    
+    def cleanup(self):
+        """Clean up screen resources"""
+        # Stop scheduled updates
+        self._stop_clock()
+        
+        # Call parent cleanup
+        super().cleanup()
     
     def get_system_info(self):
         """Get comprehensive system information"""
@@ -286,10 +286,9 @@ class MainIdleScreen(BaseScreen):
         # Update button text to show what it will switch TO (not current state)
         button.text = 'LIGHT' if is_dark else 'DARK'
         
-        # Refresh all screens for theme change
-        if self.navigation_manager:
-            self.navigation_manager.refresh_all_screens()
-        else:
+        # Screens registered with the navigation manager are refreshed
+        # through the theme change subscription
+        if not self.navigation_manager:
             # Fallback: refresh current layout
             self.handle_theme_change()
         